@@ -0,0 +1,74 @@
+"""Snapshot size and load time with old completed tasks archived, and reading them back
+
+Run from the repository root: python benchmarks/bench_archive.py
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from focusflick_core import FocusCore, default_data
+from focusflick_storage import TaskArchive
+
+TASKS = 50000
+DAYS = 3 * 365
+NOTES_PER_TASK = 2
+
+
+def make_data():
+    """TASKS completed tasks spread over DAYS days, with notes"""
+    data = default_data()
+    today = datetime.now()
+    for i in range(TASKS):
+        done = (today - timedelta(days=i * DAYS // TASKS)).isoformat()
+        data["user"]["tasks"].append({
+            "id": f"t{i}",
+            "name": f"Task {i}",
+            "priority": 2,
+            "completed": True,
+            "created": done,
+            "completed_date": done,
+            "description": "Read the chapter and do the exercises",
+            "notes": [{"date": done, "content": f"Note {n} on task {i}"} for n in range(NOTES_PER_TASK)]
+        })
+    return data
+
+
+def load(text, archive=None):
+    """Seconds to parse a snapshot and build the core over it"""
+    t = time.perf_counter()
+    FocusCore(json.loads(text), archive=archive)
+    return time.perf_counter() - t
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        data = make_data()
+        text = json.dumps(data)
+        print(f"Before: snapshot {len(text) / (1 << 20):6.1f} MiB, load {load(text) * 1000:6.0f} ms")
+        
+        archive = TaskArchive(os.path.join(tmp, "archive"))
+        core = FocusCore(data, archive=archive)
+        t = time.perf_counter()
+        archived = core.archive_tasks(date.today(), core.apply_payload)
+        elapsed = time.perf_counter() - t
+        text = json.dumps(data)
+        print(f"Archived {archived} tasks in {elapsed * 1000:.0f} ms into {len(archive.months())} segments")
+        print(f"After:  snapshot {len(text) / (1 << 20):6.1f} MiB, load {load(text, archive) * 1000:6.0f} ms")
+        
+        # A fresh archive reads only the segments a range needs
+        today = date.today()
+        for days in (30, 365, None):
+            core = FocusCore(json.loads(text), archive=TaskArchive(archive.directory))
+            t = time.perf_counter()
+            tasks = core.completed_between(today - timedelta(days=days) if days else None, today)
+            label = f"last {days} days" if days else "all time"
+            print(f"Completed {label:>14}: {len(tasks):6} tasks in {(time.perf_counter() - t) * 1000:6.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Drive the headless core through simulated study days
+
+Run from the repository root: python benchmarks/bench_core.py
+No window is created, so this measures the accounting rules alone.
+"""
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from focusflick_core import FocusCore, default_data, new_id, new_session
+
+DAYS = 365
+TASKS_PER_DAY = 10
+HABITS = 20
+SESSIONS_PER_DAY = 8
+
+
+def simulate(core):
+    """Run DAYS of sessions, task and habit toggles, returns the event count"""
+    random.seed(1)
+    events = 0
+
+    def emit(event_type, payload):
+        nonlocal events
+        events += 1
+        core.apply_payload(event_type, payload)
+    
+    for i in range(HABITS):
+        emit("habit_added", {"habit": {"id": new_id(), "name": f"Habit {i}", "active": True, "completions": []}})
+    
+    now = datetime(2024, 1, 1, 9)
+    for day in range(DAYS):
+        core.daily_reset(now, emit)
+        for i in range(TASKS_PER_DAY):
+            task = {"id": new_id(), "name": f"Task {day}-{i}", "priority": random.randint(1, 3), "completed": False}
+            emit("task_added", {"task": task})
+        for task in core.tasks.active()[:TASKS_PER_DAY // 2]:
+            core.toggle_task(task, True, now, emit)
+        for habit in core.habits.active():
+            core.toggle_habit(habit, random.random() < 0.7, now.date(), emit)
+        for _ in range(SESSIONS_PER_DAY):
+            core.commit_session(new_session("focus", random.randint(30, 3600), now), emit)
+            now += timedelta(minutes=30)
+        now += timedelta(days=1) - timedelta(minutes=30 * SESSIONS_PER_DAY)
+    return events
+
+
+def main():
+    core = FocusCore(default_data())
+    start = time.perf_counter()
+    events = simulate(core)
+    elapsed = time.perf_counter() - start
+    
+    user = core.data["user"]
+    sessions = DAYS * SESSIONS_PER_DAY
+    print(f"{DAYS} days, {sessions} sessions, {events} events in {elapsed * 1000:.1f} ms")
+    print(f"{sessions / elapsed:,.0f} sessions/s  {events / elapsed:,.0f} events/s")
+    print(f"level {user['level']}  xp {user['xp']}  streak {user['streak']}  sessions {user['sessions']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Compare re-parsing stored dates with the parse-once date indexes
+
+Run from the repository root: python benchmarks/bench_dates.py
+"""
+import os
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from focusflick_core import HabitDates, TaskDates, new_id
+
+TASKS = 10000
+HABITS = 50
+COMPLETIONS_PER_HABIT = 1000
+ROUNDS = 20
+
+
+def make_profile():
+    """Build a large synthetic user profile"""
+    random.seed(1)
+    today = datetime.now()
+    tasks = []
+    for i in range(TASKS):
+        task = {"id": new_id(), "name": f"Task {i}", "completed": i % 2 == 0}
+        if task["completed"]:
+            task["completed_date"] = (today - timedelta(days=random.randint(0, 1000))).isoformat()
+        if i % 3 == 0:
+            task["due_date"] = (today + timedelta(days=random.randint(0, 60))).isoformat()
+        tasks.append(task)
+    
+    habits = []
+    for i in range(HABITS):
+        days = sorted(random.sample(range(3000), COMPLETIONS_PER_HABIT))
+        habits.append({
+            "id": new_id(),
+            "name": f"Habit {i}",
+            "completions": [(date.today() - timedelta(days=d)).isoformat() for d in days]
+        })
+    return tasks, habits
+
+
+def reparse(tasks, habits, start_date, end_date):
+    """The old approach, parsing every string on each pass"""
+    completed = 0
+    for task in tasks:
+        if task.get("completed") and "completed_date" in task:
+            day = datetime.fromisoformat(task["completed_date"]).date()
+            if start_date <= day <= end_date:
+                completed += 1
+        if "due_date" in task:
+            datetime.fromisoformat(task["due_date"]).strftime("%m/%d")
+    
+    habit_days = 0
+    for habit in habits:
+        for date_str in habit["completions"]:
+            day = datetime.fromisoformat(date_str).date()
+            if start_date <= day <= end_date:
+                habit_days += 1
+    return completed, habit_days
+
+
+def parse_once(task_dates, habit_dates, start_date, end_date):
+    """Dates parsed at load time, queried as ordinals"""
+    completed = len(task_dates.completed_between(start_date, end_date))
+    for due in task_dates.due.values():
+        due.strftime("%m/%d")
+    return completed, habit_dates.count_between(start_date, end_date)
+
+
+def timed(label, func, *args):
+    """Run func ROUNDS times and print the mean"""
+    result = func(*args)
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        func(*args)
+    elapsed = (time.perf_counter() - start) / ROUNDS
+    print(f"{label:<12} {elapsed * 1000:8.2f} ms per pass  {result}")
+    return elapsed
+
+
+def main():
+    tasks, habits = make_profile()
+    end_date = date.today()
+    start_date = end_date - timedelta(days=30)
+    
+    start = time.perf_counter()
+    task_dates = TaskDates()
+    task_dates.rebuild(tasks)
+    habit_dates = HabitDates()
+    habit_dates.rebuild(habits)
+    print(f"{TASKS} tasks, {HABITS * COMPLETIONS_PER_HABIT} habit completions")
+    print(f"index build  {(time.perf_counter() - start) * 1000:8.2f} ms once")
+    
+    old = timed("reparse", reparse, tasks, habits, start_date, end_date)
+    new = timed("parse once", parse_once, task_dates, habit_dates, start_date, end_date)
+    print(f"speedup      {old / new:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Read time and peak memory of a large export, streamed against json.load
+
+Run from the repository root: python benchmarks/bench_import.py
+"""
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from focusflick_core import SessionStore, default_data, new_id
+from focusflick_import import merge_events, read_export
+
+TASKS = 5000
+NOTES_PER_TASK = 4
+HABITS = 50
+SESSIONS = 100000
+
+
+def make_export(path):
+    """An export with TASKS tasks, HABITS year-long habits and SESSIONS sessions"""
+    random.seed(1)
+    data = default_data()
+    for i in range(TASKS):
+        data["user"]["tasks"].append({
+            "id": new_id(),
+            "name": f"Task {i}",
+            "priority": random.randint(1, 3),
+            "completed": i % 2 == 0,
+            "created": "2026-01-01T09:00:00",
+            "completed_date": "2026-02-01T09:00:00",
+            "description": "Read the chapter and do the exercises",
+            "notes": [{"date": "2026-01-02T09:00:00", "content": f"Note {n} on task {i}"} for n in range(NOTES_PER_TASK)]
+        })
+    for i in range(HABITS):
+        data["user"]["habits"].append({
+            "id": new_id(),
+            "name": f"Habit {i}",
+            "created": "2025-01-01T09:00:00",
+            "active": True,
+            "completions": [f"2025-{m:02d}-{d:02d}" for m in range(1, 13) for d in range(1, 29)]
+        })
+    start = 1.7e9
+    data["sessions"] = [[start + i * 3600, start + i * 3600 + 1500, "focus", None, 1500] for i in range(SESSIONS)]
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+
+def measure(read):
+    """Seconds and peak MiB of a read, timed without tracemalloc slowing it down"""
+    t = time.perf_counter()
+    result = read()
+    elapsed = time.perf_counter() - t
+    tracemalloc.start()
+    read()
+    peak = tracemalloc.get_traced_memory()[1] / (1 << 20)
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "export.json")
+        make_export(path)
+        print(f"Export: {os.path.getsize(path) / (1 << 20):.1f} MiB")
+        
+        def load():
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        
+        _, elapsed, peak = measure(load)
+        print(f"json.load     {elapsed * 1000:8.0f} ms  peak {peak:6.1f} MiB")
+        imported, elapsed, peak = measure(lambda: read_export(path))
+        print(f"read_export   {elapsed * 1000:8.0f} ms  peak {peak:6.1f} MiB  (validated, {imported['skipped']} skipped)")
+        
+        # Merging into a copy of itself finds nothing new
+        sessions = SessionStore()
+        sessions.add_many(imported["sessions"])
+        t = time.perf_counter()
+        events = merge_events(imported["data"], sessions, imported)
+        print(f"merge_events  {(time.perf_counter() - t) * 1000:8.0f} ms  {len(events)} events")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Measure the import cost of FocusFlick with python -X importtime
+
+Run from the repository root: python benchmarks/bench_import_time.py
+Pass --record FILE to append the result as a JSON line, so the cost can
+be compared across commits.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULES = ("FocusFlick", "focusflick_core", "focusflick_import", "focusflick_search", "focusflick_storage", "focusflick_sync", "focusflick_widgets")
+
+
+def measure(module):
+    """Import module in a fresh interpreter, returns {name: (self_us, cumulative_us)}"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def git_commit():
+    """Short hash of the checked out commit, if this is a git checkout"""
+    try:
+        result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True)
+        return result.stdout.strip() or None
+    except OSError:
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="fresh interpreters per module")
+    parser.add_argument("--top", type=int, default=10, help="slowest imports to list")
+    parser.add_argument("--record", help="append the results to this JSON lines file")
+    args = parser.parse_args()
+    
+    results = {}
+    for module in MODULES:
+        runs = [measure(module) for _ in range(args.runs)]
+        results[module] = statistics.median(run[module][1] for run in runs) / 1000
+        print(f"{module:<22} {results[module]:8.1f} ms cumulative (median of {args.runs})")
+
+    # Where the time goes when the app itself is imported
+    app = measure("FocusFlick")
+    print("\nSlowest imports under FocusFlick (self time):")
+    for name, (self_us, cumulative_us) in sorted(app.items(), key=lambda i: -i[1][0])[:args.top]:
+        print(f"  {name:<40} {self_us / 1000:8.1f} ms")
+    
+    if args.record:
+        entry = {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "commit": git_commit(),
+            "python": sys.version.split()[0],
+            "modules": results
+        }
+        with open(args.record, "a") as f:
+            f.write(json.dumps(entry) + "\n")
+        print(f"\nRecorded to {args.record}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Query latency of the note search index
+
+Run from the repository root: python benchmarks/bench_search.py
+"""
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from focusflick_search import SearchIndex
+
+TASKS = 2000
+NOTES = 50000
+WORDS = 20000
+# Common words, rare words, prefixes and a prefix matching half the vocabulary
+QUERIES = ("derivation", "deriv", "integral chain", "partial fraction march", "th", "q", "w1", "zzz")
+ROUNDS = 50
+
+
+def make_tasks():
+    """Tasks with NOTES notes drawn from a Zipf-like vocabulary"""
+    random.seed(1)
+    vocabulary = [f"w{i}" for i in range(WORDS)]
+    weights = [1 / (rank + 1) for rank in range(WORDS)]
+    random.shuffle(weights)
+    for word in ("derivation", "derivative", "integral", "chain", "rule", "partial",
+                 "fraction", "march", "the", "theorem", "proof", "quiz", "question"):
+        vocabulary.append(word)
+        weights.append(0.02)
+    start = datetime(2020, 1, 1)
+    tasks = [{"id": f"t{i}", "name": f"Task {i}", "notes": []} for i in range(TASKS)]
+    for i in range(NOTES):
+        words = random.choices(vocabulary, weights, k=random.randint(10, 40))
+        tasks[i % TASKS]["notes"].append({
+            "date": (start + timedelta(hours=i)).isoformat(),
+            "content": " ".join(words)
+        })
+    return tasks
+
+
+def main():
+    tasks = make_tasks()
+    index = SearchIndex()
+    start = time.perf_counter()
+    index.rebuild(tasks)
+    print(f"{NOTES} notes, {len(index.postings)} distinct words")
+    print(f"index build  {(time.perf_counter() - start) * 1000:8.1f} ms once")
+    
+    for query in QUERIES:
+        times = []
+        for _ in range(ROUNDS):
+            start = time.perf_counter()
+            results = index.search(query)
+            times.append(time.perf_counter() - start)
+        print(f"{query!r:<26} median {statistics.median(times) * 1000:6.2f} ms  max {max(times) * 1000:6.2f} ms  {len(results)} shown")
+
+
+if __name__ == "__main__":
+    main()
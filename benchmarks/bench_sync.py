@@ -0,0 +1,73 @@
+"""Cost of merging another device's sync log, by history size and new entries
+
+Run from the repository root: python benchmarks/bench_sync.py
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from focusflick_core import FocusCore, default_data
+from focusflick_sync import SyncFolder, merge_changes
+
+HISTORY = (10000, 100000)
+NEW = 100
+ROUNDS = 20
+
+
+def entries(start, count):
+    """Log entries of another device: a task, then edits, notes and XP"""
+    for i in range(start, start + count):
+        stamp = [1.7e9 + i, "remote"]
+        if i % 4 == 0:
+            yield {"type": "task_added", "day": "2026-10-01", "stamp": stamp,
+                   "task": {"id": f"t{i}", "name": f"Task {i}", "priority": 1, "completed": False}}
+        elif i % 4 == 1:
+            yield {"type": "task_updated", "day": "2026-10-01", "stamp": stamp, "id": f"t{i - 1}", "fields": {"name": f"Task {i}!"}}
+        elif i % 4 == 2:
+            yield {"type": "task_note_added", "day": "2026-10-01", "stamp": stamp, "id": f"t{i - 2}",
+                   "note": {"date": "2026-10-01T10:00:00", "content": f"Note {i}"}}
+        else:
+            yield {"type": "xp_awarded", "day": "2026-10-01", "stamp": stamp, "amount": 10}
+
+
+def write(path, start, count):
+    with open(path, "a", encoding="utf-8") as f:
+        for entry in entries(start, count):
+            f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+
+
+def merge(core, folder):
+    """Pull and apply like the app does, returns the entries merged"""
+    merged, rows = merge_changes(core, folder.pull(core.data["sync"]["offsets"]), core.apply_payload)
+    return merged
+
+
+def main():
+    for history in HISTORY:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "remote.jsonl")
+            write(path, 0, history)
+            core = FocusCore(default_data())
+            folder = SyncFolder(tmp, "local")
+            
+            t = time.perf_counter()
+            merge(core, folder)
+            full = time.perf_counter() - t
+            
+            times = []
+            for r in range(ROUNDS):
+                write(path, history + r * NEW, NEW)
+                t = time.perf_counter()
+                merge(core, folder)
+                times.append(time.perf_counter() - t)
+            times.sort()
+            print(f"{history:>7} entries: first merge {full * 1000:8.0f} ms, "
+                  f"then {NEW} new {times[len(times) // 2] * 1000:6.1f} ms median")
+
+
+if __name__ == "__main__":
+    main()
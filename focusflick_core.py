@@ -0,0 +1,1389 @@
+import heapq
+import math
+import time
+from abc import ABC, abstractmethod
+from array import array
+from bisect import bisect_left, bisect_right
+from contextlib import nullcontext
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from operator import itemgetter
+
+from focusflick_search import SearchIndex
+
+DATE_CACHE_SIZE = 4096
+
+
+def new_id():
+    """Generate a stable id for tasks and habits"""
+    # uuid is slow to import and only needed when something is created
+    import uuid
+    return uuid.uuid4().hex
+
+
+def find_by_id(items, item_id):
+    """Find a task or habit by id"""
+    for item in items:
+        if item.get("id") == item_id:
+            return item
+    return None
+
+
+def day_start_timestamp(day):
+    """Local midnight of a date as a UNIX timestamp"""
+    return datetime.combine(day, datetime.min.time()).timestamp()
+
+
+def ensure_ids(data):
+    """Give every task and habit an id, returns True if any were missing"""
+    changed = False
+    for item in data["user"]["tasks"] + data["user"]["habits"]:
+        if "id" not in item:
+            item["id"] = new_id()
+            changed = True
+    return changed
+
+
+# ===== Dates =====
+# Stored timestamps are ISO strings. They are parsed once when a task enters
+# the model, anything else goes through a bounded cache.
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def parse_timestamp(text):
+    """Parse an ISO date or timestamp string"""
+    return datetime.fromisoformat(text)
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def day_ordinal(text):
+    """Ordinal day number of an ISO date or timestamp string"""
+    return parse_timestamp(text[:10]).toordinal()
+
+
+class TaskDates:
+    """Parsed due and completion dates of the tasks, keyed by task id"""
+    
+    TASK_EVENTS = ("task_added", "task_updated", "task_toggled", "task_deleted")
+
+    def __init__(self):
+        self.due = {}
+        self.completed = {}
+
+    def rebuild(self, tasks):
+        """Parse the dates of every task"""
+        self.due.clear()
+        self.completed.clear()
+        for task in tasks:
+            self.update(task)
+
+    def update(self, task):
+        """Re-parse the dates of one task"""
+        task_id = task.get("id")
+        self.due.pop(task_id, None)
+        self.completed.pop(task_id, None)
+        if task.get("due_date"):
+            self.due[task_id] = parse_timestamp(task["due_date"])
+        if task.get("completed") and task.get("completed_date"):
+            self.completed[task_id] = day_ordinal(task["completed_date"])
+
+    def apply(self, event, find):
+        """Keep the dates in step with an applied event, find(task_id) returns a task"""
+        if event["type"] == "tasks_archived":
+            for ids in event["months"].values():
+                for task_id in ids:
+                    self.due.pop(task_id, None)
+                    self.completed.pop(task_id, None)
+            return
+        if event["type"] not in self.TASK_EVENTS:
+            return
+        task = find(event.get("id") or event.get("task", {}).get("id"))
+        if task is None:
+            self.due.pop(event.get("id"), None)
+            self.completed.pop(event.get("id"), None)
+        else:
+            self.update(task)
+
+    def completed_between(self, start_date=None, end_date=None):
+        """Ids of tasks completed within the date range"""
+        first = start_date.toordinal() if start_date else 0
+        last = end_date.toordinal() if end_date else date.max.toordinal()
+        return {task_id for task_id, day in self.completed.items() if first <= day <= last}
+
+
+class HabitCompletions:
+    """Sorted, de-duplicated completion days of one habit with cached streaks"""
+
+    def __init__(self, days=()):
+        self.members = set(days)
+        self.days = array('l', sorted(self.members))
+        # Length of the run ending at the latest day, and the longest run
+        self.tail = self._run_from(self.days[-1], -1) if self.days else 0
+        self.longest = self._longest()
+
+    def __contains__(self, day):
+        return day in self.members
+
+    def __len__(self):
+        return len(self.days)
+
+    def _run_from(self, day, step):
+        """Length of the run of consecutive days starting at day"""
+        length = 0
+        while day in self.members:
+            length += 1
+            day += step
+        return length
+
+    def _longest(self):
+        """Longest run over all days, only needed after removals"""
+        longest = run = 0
+        previous = None
+        for day in self.days:
+            run = run + 1 if previous == day - 1 else 1
+            longest = max(longest, run)
+            previous = day
+        return longest
+
+    def add(self, day):
+        """Mark a day as completed"""
+        if day in self.members:
+            return
+        self.members.add(day)
+        self.days.insert(bisect_left(self.days, day), day)
+        
+        # The new day may join the runs on either side of it
+        after = self._run_from(day + 1, 1)
+        run = self._run_from(day, -1) + after
+        self.longest = max(self.longest, run)
+        if day + after == self.days[-1]:
+            self.tail = run
+
+    def remove(self, day):
+        """Clear a completed day"""
+        if day not in self.members:
+            return
+        run = self._run_from(day, -1) + self._run_from(day + 1, 1)
+        self.members.discard(day)
+        del self.days[bisect_left(self.days, day)]
+        
+        self.tail = self._run_from(self.days[-1], -1) if self.days else 0
+        if run == self.longest:
+            self.longest = self._longest()
+
+    def count_between(self, first, last):
+        """Number of completions between two day ordinals, inclusive"""
+        return bisect_right(self.days, last) - bisect_left(self.days, first)
+
+    def current_streak(self, today):
+        """Consecutive days completed up to and including today"""
+        return self.tail if self.days and self.days[-1] == today else 0
+
+
+class HabitDates:
+    """Completions of each habit as HabitCompletions, keyed by habit id"""
+
+    def __init__(self):
+        self.habits = {}
+
+    def get(self, habit_id):
+        """Completions of a habit, empty if it has none"""
+        return self.habits.get(habit_id) or HabitCompletions()
+
+    def rebuild(self, habits):
+        """Parse the completions of every habit"""
+        self.habits.clear()
+        for habit in habits:
+            self.update(habit)
+
+    def update(self, habit):
+        """Re-parse the completions of one habit"""
+        days = (day_ordinal(d) for d in habit.get("completions", []))
+        self.habits[habit.get("id")] = HabitCompletions(days)
+
+    def apply(self, event, find):
+        """Keep the completions in step with an applied event, find(habit_id) returns a habit"""
+        kind = event["type"]
+        if kind == "habit_completion_added":
+            self.habits.setdefault(event["id"], HabitCompletions()).add(day_ordinal(event["date"]))
+        elif kind == "habit_completion_removed":
+            if event["id"] in self.habits:
+                self.habits[event["id"]].remove(day_ordinal(event["date"]))
+        elif kind == "habit_added":
+            self.update(event["habit"])
+        elif kind == "habit_updated" and "completions" in event.get("fields", {}):
+            habit = find(event["id"])
+            if habit is not None:
+                self.update(habit)
+        elif kind == "habit_deleted":
+            self.habits.pop(event["id"], None)
+
+    def count_between(self, start_date=None, end_date=None):
+        """Number of habit completions within the date range"""
+        first = start_date.toordinal() if start_date else 0
+        last = end_date.toordinal() if end_date else date.max.toordinal()
+        return sum(habit.count_between(first, last) for habit in self.habits.values())
+
+
+# ===== Daily Rollup =====
+# data["rollup"] maps an ISO day to one counter per ROLLUP_FIELDS entry and is
+# updated by the event handlers, so range stats are sums over a few days.
+
+ROLLUP_FIELDS = ("focus_seconds", "sessions", "tasks_completed", "habit_completions", "xp")
+FOCUS_SECONDS, SESSIONS, TASKS_COMPLETED, HABIT_COMPLETIONS, XP = range(len(ROLLUP_FIELDS))
+
+
+def bump_rollup(data, day, field, amount):
+    """Add amount to one counter of a day's rollup"""
+    if not day:
+        return
+    counters = data.setdefault("rollup", {}).setdefault(day, [0] * len(ROLLUP_FIELDS))
+    counters[field] += amount
+
+
+def rollup_totals(rollup, start_date=None, end_date=None):
+    """Sum the rollup counters over a date range, None means unbounded"""
+    totals = [0] * len(ROLLUP_FIELDS)
+    if start_date is None or end_date is None:
+        first = start_date.isoformat() if start_date else ""
+        last = end_date.isoformat() if end_date else "9999"
+        days = (counters for day, counters in rollup.items() if first <= day <= last)
+    else:
+        days = (rollup.get(date.fromordinal(n).isoformat())
+                for n in range(start_date.toordinal(), end_date.toordinal() + 1))
+    for counters in days:
+        if counters:
+            for i, value in enumerate(counters):
+                totals[i] += value
+    return totals
+
+
+def rollup_series(rollup, field, start_date, end_date):
+    """Per-day values of one rollup counter, skipping days without any"""
+    series = {}
+    for n in range(start_date.toordinal(), end_date.toordinal() + 1):
+        day = date.fromordinal(n).isoformat()
+        counters = rollup.get(day)
+        if counters and counters[field]:
+            series[day] = counters[field]
+    return series
+
+
+def rollup_first_day(rollup):
+    """Earliest day present in the rollup, or None"""
+    return date.fromisoformat(min(rollup)) if rollup else None
+
+
+def rollup_day(event, data):
+    """ISO day whose rollup an event changes, or None"""
+    kind = event["type"]
+    if kind == "task_toggled":
+        task = find_by_id(data["user"]["tasks"], event["id"])
+        if task and task.get("completed_date"):
+            return task["completed_date"][:10]
+    elif kind in ("habit_completion_added", "habit_completion_removed"):
+        return event["date"]
+    elif kind in ("session_completed", "time_credited", "xp_awarded", "sessions_imported"):
+        return event.get("day")
+    return None
+
+
+def build_rollup(data, sessions):
+    """Rebuild the rollup from session records, tasks and habits"""
+    data["rollup"] = {}
+    for start, end, mode, task, duration in sessions.sessions():
+        day = date.fromtimestamp(start).isoformat()
+        bump_rollup(data, day, FOCUS_SECONDS, duration)
+        bump_rollup(data, day, SESSIONS, 1)
+    for task in data["user"]["tasks"]:
+        if task.get("completed") and task.get("completed_date"):
+            bump_rollup(data, task["completed_date"][:10], TASKS_COMPLETED, 1)
+    for habit in data["user"]["habits"]:
+        for day in habit.get("completions", []):
+            bump_rollup(data, day, HABIT_COMPLETIONS, 1)
+
+
+# ===== Event Handlers =====
+# Every mutation of the data tree is described by a small event dict so it can
+# be appended to the event log and replayed on top of the last snapshot.
+
+def _session_completed(data, event, find):
+    user = data["user"]
+    user["sessions"] += 1
+    user["total_seconds"] += event["seconds"]
+    user["xp"] += event["xp"]
+    bump_rollup(data, event.get("day"), FOCUS_SECONDS, event["seconds"])
+    bump_rollup(data, event.get("day"), SESSIONS, 1)
+    bump_rollup(data, event.get("day"), XP, event["xp"])
+
+
+def _time_credited(data, event, find):
+    data["user"]["total_seconds"] += event["seconds"]
+    bump_rollup(data, event.get("day"), FOCUS_SECONDS, event["seconds"])
+
+
+def _sessions_imported(data, event, find):
+    # Sessions of one day from another device's history, no XP attached
+    seconds = sum(row[4] for row in event["sessions"])
+    data["user"]["sessions"] += len(event["sessions"])
+    data["user"]["total_seconds"] += seconds
+    bump_rollup(data, event["day"], FOCUS_SECONDS, seconds)
+    bump_rollup(data, event["day"], SESSIONS, len(event["sessions"]))
+
+
+def _xp_awarded(data, event, find):
+    data["user"]["xp"] += event["amount"]
+    bump_rollup(data, event.get("day"), XP, event["amount"])
+
+
+def _level_changed(data, event, find):
+    data["user"]["level"] = event["level"]
+    data["user"]["xp"] = event["xp"]
+
+
+def _streak_updated(data, event, find):
+    data["user"]["streak"] = event["streak"]
+    data["user"]["last_session"] = event["last_session"]
+
+
+def _achievement_unlocked(data, event, find):
+    data["user"]["achievements"].append(event["achievement"])
+
+
+def _sync_changed(data, event, find):
+    data["sync"].update(event["fields"])
+
+
+def _sync_merged(data, event, find):
+    data["sync"]["offsets"][event["log"]] = event["offset"]
+
+
+def _sync_baseline(data, event, find):
+    # XP earned before joining counts once, as the largest device total,
+    # since devices often start from copies of the same history
+    sync = data["sync"]
+    joined = sync.setdefault("joined", {})
+    own = sync["device"]
+    credited = max(joined.values()) - joined[own] if own in joined else 0
+    joined[event["log"]] = event["total"]
+    if own in joined:
+        data["user"]["xp"] += max(joined.values()) - joined[own] - credited
+
+
+def _user_changed(data, event, find):
+    data["user"][event["key"]] = event["value"]
+
+
+def _setting_changed(data, event, find):
+    data["settings"][event["key"]] = event["value"]
+
+
+def _task_added(data, event, find):
+    data["user"]["tasks"].append(event["task"])
+
+
+def _task_updated(data, event, find):
+    task = find("tasks", event["id"])
+    if task is None:
+        return
+    task.update(event.get("fields", {}))
+    for key in event.get("removed", []):
+        task.pop(key, None)
+
+
+def _task_toggled(data, event, find):
+    task = find("tasks", event["id"])
+    if task is None:
+        return
+    was_completed = task.get("completed", False)
+    task["completed"] = event["completed"]
+    if event["completed"]:
+        task["completed_date"] = event["date"]
+        if not was_completed:
+            bump_rollup(data, event["date"][:10], TASKS_COMPLETED, 1)
+    elif was_completed and task.get("completed_date"):
+        bump_rollup(data, task["completed_date"][:10], TASKS_COMPLETED, -1)
+
+
+def _task_note_added(data, event, find):
+    task = find("tasks", event["id"])
+    if task is None:
+        return
+    task.setdefault("notes", []).append(event["note"])
+
+
+def _task_deleted(data, event, find):
+    task = find("tasks", event["id"])
+    if task is not None:
+        data["user"]["tasks"].remove(task)
+
+
+def _tasks_archived(data, event, find):
+    # Completed tasks moved to the archive segments, by month of completion
+    archived = data.setdefault("archived", {})
+    for month, ids in event["months"].items():
+        for task_id in ids:
+            archived[task_id] = month
+    data["user"]["tasks"][:] = [task for task in data["user"]["tasks"] if task["id"] not in archived]
+
+
+def _habit_added(data, event, find):
+    data["user"]["habits"].append(event["habit"])
+
+
+def _habit_updated(data, event, find):
+    habit = find("habits", event["id"])
+    if habit is None:
+        return
+    habit.update(event.get("fields", {}))
+    for key in event.get("removed", []):
+        habit.pop(key, None)
+
+
+def _habit_completion_added(data, event, find):
+    habit = find("habits", event["id"])
+    if habit is None:
+        return
+    completions = habit.setdefault("completions", [])
+    if event["date"] not in completions:
+        completions.append(event["date"])
+        bump_rollup(data, event["date"], HABIT_COMPLETIONS, 1)
+
+
+def _habit_completion_removed(data, event, find):
+    habit = find("habits", event["id"])
+    if habit is None:
+        return
+    if event["date"] in habit.get("completions", []):
+        habit["completions"].remove(event["date"])
+        bump_rollup(data, event["date"], HABIT_COMPLETIONS, -1)
+
+
+def _habit_deleted(data, event, find):
+    habit = find("habits", event["id"])
+    if habit is not None:
+        data["user"]["habits"].remove(habit)
+
+
+EVENT_HANDLERS = {
+    "session_completed": _session_completed,
+    "time_credited": _time_credited,
+    "sessions_imported": _sessions_imported,
+    "xp_awarded": _xp_awarded,
+    "level_changed": _level_changed,
+    "streak_updated": _streak_updated,
+    "achievement_unlocked": _achievement_unlocked,
+    "user_changed": _user_changed,
+    "setting_changed": _setting_changed,
+    "sync_changed": _sync_changed,
+    "sync_merged": _sync_merged,
+    "sync_baseline": _sync_baseline,
+    "task_added": _task_added,
+    "task_updated": _task_updated,
+    "task_toggled": _task_toggled,
+    "task_note_added": _task_note_added,
+    "task_deleted": _task_deleted,
+    "tasks_archived": _tasks_archived,
+    "habit_added": _habit_added,
+    "habit_updated": _habit_updated,
+    "habit_completion_added": _habit_completion_added,
+    "habit_completion_removed": _habit_completion_removed,
+    "habit_deleted": _habit_deleted,
+}
+
+
+def event_registers(event):
+    """Last-writer-wins registers an event writes, as keys of data["sync_stamps"]"""
+    kind = event["type"]
+    if kind in ("task_updated", "habit_updated"):
+        prefix = kind.split("_")[0]
+        return [f"{prefix}:{event['id']}:{key}" for key in (*event.get("fields", {}), *event.get("removed", []))]
+    if kind == "task_toggled":
+        return [f"task:{event['id']}:completed"]
+    if kind in ("task_deleted", "habit_deleted"):
+        return [f"{kind.split('_')[0]}:{event['id']}:deleted"]
+    if kind in ("habit_completion_added", "habit_completion_removed"):
+        return [f"habit:{event['id']}:{event['date']}"]
+    if kind == "user_changed":
+        return [f"user:{event['key']}"]
+    if kind == "setting_changed":
+        return [f"settings:{event['key']}"]
+    if kind == "streak_updated":
+        return ["user:streak"]
+    return []
+
+
+def apply_event(data, event, find=None):
+    """Apply a single mutation event to the data tree
+    
+    find(section, item_id) returns a task or habit, by default by
+    scanning the list. FocusCore passes its stores' indexes.
+    """
+    handler = EVENT_HANDLERS.get(event["type"])
+    if handler is None:
+        raise ValueError(f"Unknown event type: {event['type']}")
+    if find is None:
+        def find(section, item_id):
+            return find_by_id(data["user"][section], item_id)
+    handler(data, event, find)
+    # Synced events carry a [time, device] stamp, the newest write wins
+    if "stamp" in event:
+        stamps = data.setdefault("sync_stamps", {})
+        for register in event_registers(event):
+            if register not in stamps or event["stamp"] > stamps[register]:
+                stamps[register] = event["stamp"]
+
+
+class TimerEngine:
+    """Pausable timer whose elapsed time is measured on the monotonic clock
+    
+    Running time is the sum of running segments on the monotonic clock, so
+    wall clock changes (NTP, manual edits, time zones) don't warp it. The
+    wall clock only anchors when the timer was started, for the session
+    history. If tick() sees a gap longer than max_gap, e.g. after the
+    machine slept, the gap is not counted as running time.
+    """
+
+    def __init__(self, max_gap=None, monotonic=time.monotonic, wall=time.time):
+        self.max_gap = max_gap
+        self.monotonic = monotonic
+        self.wall = wall
+        self.reset()
+
+    def reset(self):
+        """Stop the timer and clear its time"""
+        self.running = False
+        self.started_wall = None
+        # Seconds of finished running segments
+        self.accumulated = 0.0
+        self.segment_start = None
+        self.last_seen = None
+
+    def start(self, paused=False):
+        """Start timing from zero, with paused the time starts at the first resume()"""
+        self.reset()
+        if not paused:
+            self.resume()
+
+    def pause(self):
+        """Close the running segment"""
+        if self.running:
+            self.tick()
+            self.accumulated += self.last_seen - self.segment_start
+            self.running = False
+
+    def resume(self):
+        """Open a new running segment, the first one anchors the wall clock"""
+        if not self.running:
+            if self.started_wall is None:
+                self.started_wall = self.wall()
+            self.segment_start = self.last_seen = self.monotonic()
+            self.running = True
+
+    def stop(self):
+        """Pause and return the elapsed seconds"""
+        self.pause()
+        return self.accumulated
+
+    def tick(self):
+        """Note that the timer was observed, dropping an over-long gap"""
+        if not self.running:
+            return
+        now = self.monotonic()
+        if self.max_gap is not None and now - self.last_seen > self.max_gap:
+            # Count the segment up to the last observation, restart it now
+            self.accumulated += self.last_seen - self.segment_start
+            self.segment_start = now
+        self.last_seen = now
+
+    def elapsed(self):
+        """Seconds spent running"""
+        if not self.running:
+            return self.accumulated
+        self.tick()
+        return self.accumulated + self.last_seen - self.segment_start
+
+
+class SessionStore:
+    """Session history kept in parallel arrays sorted by start time"""
+    
+    MODES = ("focus", "stopwatch", "pomodoro")
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.starts = array('d')
+        self.ends = array('d')
+        self.durations = array('q')
+        self.modes = array('b')
+        self.tasks = []
+        # Prefix sums of durations so range totals are two lookups
+        self.totals = array('d', [0.0])
+
+    def __len__(self):
+        return len(self.starts)
+
+    def add(self, start, end, mode, task, duration):
+        """Insert a session, keeping the arrays ordered by start time"""
+        i = bisect_right(self.starts, start)
+        self.starts.insert(i, start)
+        self.ends.insert(i, end)
+        self.durations.insert(i, duration)
+        self.modes.insert(i, self.MODES.index(mode))
+        self.tasks.insert(i, task)
+        
+        if i == len(self.starts) - 1:
+            self.totals.append(self.totals[-1] + duration)
+        else:
+            # Out of order (e.g. imported history), rebuild the tail
+            del self.totals[i + 1:]
+            for d in self.durations[i:]:
+                self.totals.append(self.totals[-1] + d)
+
+    def add_many(self, rows):
+        """Insert (start, end, mode, task, duration) rows, sorting only once"""
+        rows = sorted([*self.sessions(), *rows], key=lambda row: row[0])
+        self.clear()
+        for row in rows:
+            self.add(*row)
+
+    def has(self, start, mode):
+        """True if a session of mode starts within a millisecond of start, as stored"""
+        code = self.MODES.index(mode)
+        i = bisect_left(self.starts, start - 0.001)
+        while i < len(self.starts) and self.starts[i] <= start + 0.001:
+            if self.modes[i] == code:
+                return True
+            i += 1
+        return False
+
+    def _bounds(self, start_date, end_date):
+        """Index range of sessions starting within the given days"""
+        i = 0 if start_date is None else bisect_left(self.starts, day_start_timestamp(start_date))
+        if end_date is None:
+            return i, len(self.starts)
+        j = bisect_left(self.starts, day_start_timestamp(end_date + timedelta(days=1)))
+        return i, max(i, j)
+
+    def total_seconds(self, start_date=None, end_date=None):
+        """Total duration of sessions started in the date range"""
+        i, j = self._bounds(start_date, end_date)
+        return int(self.totals[j] - self.totals[i])
+
+    def count(self, start_date=None, end_date=None):
+        """Number of sessions started in the date range"""
+        i, j = self._bounds(start_date, end_date)
+        return j - i
+
+    def sessions(self, start_date=None, end_date=None):
+        """Yield (start, end, mode, task, duration) for the date range"""
+        i, j = self._bounds(start_date, end_date)
+        for k in range(i, j):
+            yield (self.starts[k], self.ends[k], self.MODES[self.modes[k]], self.tasks[k], self.durations[k])
+
+
+def default_data():
+    """Data tree of a new user"""
+    return {
+        "user": {
+            "name": "Student",
+            "streak": 0,
+            "total_seconds": 0,
+            "sessions": 0,
+            "last_session": None,
+            "daily_goal": 120,
+            "xp": 0,
+            "level": 1,
+            "tasks": [],
+            "habits": [],
+            "achievements": [],
+            "last_reset": datetime.now().isoformat()
+        },
+        "settings": {
+            "theme": "dark",
+            "sounds": True,
+            "focus_duration": 25,
+            "short_break": 5,
+            "long_break": 15,
+            "pomodoro_cycles": 4,
+            "notifications": True,
+            "auto_start_breaks": True,
+            "auto_start_pomodoros": True,
+            "prebuild_views": True,
+            "level_curve": "linear",
+            "save_delay_ms": 1000,
+            # Completed tasks older than this move to the archive, 0 keeps them
+            "archive_after_days": 90
+        },
+        # This device's side of folder sync, never synced itself
+        "sync": {
+            "device": None,
+            "folder": "",
+            "offsets": {},
+            # Device -> total XP it had when it joined the folder
+            "joined": {}
+        },
+        "sync_stamps": {},
+        # Archived task id -> month of the segment holding it
+        "archived": {},
+        "schema_version": SCHEMA_VERSION
+    }
+
+
+# ===== Schema =====
+# data["schema_version"] counts the migrations a data tree has had, files
+# written before it existed are version 0. Each migration upgrades the tree
+# in place from the version before it and runs once per file, so a change
+# to the layout gets a new migration instead of an edit to an old one.
+
+SCHEMA_VERSION = 3
+# Fields every task and habit has, with the value an old file gets
+TASK_FIELD_DEFAULTS = {"priority": 3, "completed": False}
+HABIT_FIELD_DEFAULTS = {"active": True}
+
+
+def fill_defaults(data, defaults):
+    """Add the keys of defaults that data lacks, recursing into dicts"""
+    for key, value in defaults.items():
+        if key not in data:
+            data[key] = value
+        elif isinstance(value, dict) and isinstance(data[key], dict):
+            fill_defaults(data[key], value)
+
+
+def ensure_fields(data):
+    """Give every task and habit an id and the fields the app reads, returns True if any were missing"""
+    changed = ensure_ids(data)
+    now = datetime.now().isoformat()
+    for items, defaults in ((data["user"]["tasks"], TASK_FIELD_DEFAULTS), (data["user"]["habits"], HABIT_FIELD_DEFAULTS)):
+        for item in items:
+            for key, value in defaults.items():
+                if key not in item:
+                    item[key] = value
+                    changed = True
+            if "created" not in item:
+                item["created"] = item.get("completed_date") or now
+                changed = True
+    return changed
+
+
+def _add_default_fields(data, sessions):
+    # Top-level sections, user fields and settings added before versioning
+    fill_defaults(data, default_data())
+
+
+def _add_item_fields(data, sessions):
+    ensure_fields(data)
+
+
+def _add_rollup(data, sessions):
+    # Per-day counters arrived after the sessions they count. Runs on the
+    # snapshot before its log is replayed, logged events then bump a
+    # complete rollup instead of starting a partial one.
+    if "rollup" not in data:
+        build_rollup(data, sessions)
+
+
+# (version, migration) in order, each takes the data tree and the SessionStore
+MIGRATIONS = (
+    (1, _add_default_fields),
+    (2, _add_item_fields),
+    (3, _add_rollup),
+)
+
+
+def migrate_data(data, sessions):
+    """Upgrade a loaded data tree to SCHEMA_VERSION, returns True if it changed
+    
+    A tree already at SCHEMA_VERSION is returned untouched without
+    looking any further.
+    """
+    version = data.get("schema_version", 0)
+    if version == SCHEMA_VERSION:
+        return False
+    if version > SCHEMA_VERSION:
+        # Written by a newer version, keep it as it is rather than guess
+        print(f"Data schema version {version} is newer than this version supports ({SCHEMA_VERSION})")
+        return False
+    for target, migration in MIGRATIONS:
+        if target > version:
+            migration(data, sessions)
+            data["schema_version"] = target
+    return True
+
+
+# ===== Stores =====
+# Read side of the tasks and habits, kept in step with the events applied.
+
+# Task events that can change which names the task pickers offer
+OPTION_EVENTS = ("task_added", "task_deleted", "task_toggled")
+
+
+class TaskStore:
+    """Tasks of the data tree with their parsed dates and indexes"""
+
+    def __init__(self, data):
+        self.data = data
+        self.dates = TaskDates()
+        self.rebuild()
+
+    def rebuild(self):
+        """Re-index every task"""
+        self.dates.rebuild(self.all())
+        self.by_id = {task["id"]: task for task in self.all()}
+        self.invalidate_options()
+
+    def invalidate_options(self):
+        # Picker label -> task id, built with the option list on demand
+        self.option_ids = None
+        self._options = None
+
+    def all(self):
+        return self.data["user"]["tasks"]
+
+    def get(self, task_id):
+        """Task with the given id, or None"""
+        return self.by_id.get(task_id)
+
+    def active(self):
+        """Incomplete tasks by priority then creation date"""
+        tasks = [t for t in self.all() if not t.get("completed", False)]
+        tasks.sort(key=lambda t: (t.get("priority", 3), t.get("created", "")))
+        return tasks
+
+    def completed(self):
+        """Completed tasks in list order"""
+        return [t for t in self.all() if t.get("completed", False)]
+
+    def completed_between(self, start_date=None, end_date=None):
+        """Tasks completed within the date range"""
+        ids = self.dates.completed_between(start_date, end_date)
+        return [t for t in self.all() if t["id"] in ids]
+
+    def archivable(self, before):
+        """Tasks completed before a date, as {month of completion: [task]}"""
+        last = before.toordinal()
+        months = {}
+        for task_id, day in self.dates.completed.items():
+            if day < last:
+                task = self.by_id[task_id]
+                months.setdefault(task["completed_date"][:7], []).append(task)
+        return months
+
+    def options(self):
+        """Labels offered by the task pickers, the same list until active tasks change
+        
+        Active tasks are listed by name, repeated names get the first free
+        (2), (3), ... suffix so every label picks exactly one task. "None"
+        stays reserved for picking no task.
+        """
+        if self._options is None:
+            self.option_ids = {}
+            active = [t for t in self.all() if not t.get("completed", False)]
+            taken = {t["name"] for t in active} | {"None"}
+            for task in active:
+                name = task["name"]
+                label = name
+                if name == "None" or name in self.option_ids:
+                    n = 2
+                    while f"{name} ({n})" in taken:
+                        n += 1
+                    label = f"{name} ({n})"
+                    taken.add(label)
+                self.option_ids[label] = task["id"]
+            self._options = ["None"] + list(self.option_ids)
+        return self._options
+
+    def option_task(self, label):
+        """Task picked by a label from options(), or None"""
+        self.options()
+        return self.by_id.get(self.option_ids.get(label))
+
+    def apply(self, event):
+        kind = event["type"]
+        if kind == "task_added":
+            self.by_id[event["task"]["id"]] = event["task"]
+        elif kind == "task_deleted":
+            self.by_id.pop(event["id"], None)
+        elif kind == "tasks_archived":
+            for ids in event["months"].values():
+                for task_id in ids:
+                    self.by_id.pop(task_id, None)
+        self.dates.apply(event, self.get)
+        if kind in OPTION_EVENTS or (kind == "task_updated" and "name" in event.get("fields", {})):
+            self.invalidate_options()
+
+
+class HabitStore:
+    """Habits of the data tree with their completion days"""
+
+    def __init__(self, data):
+        self.data = data
+        self.dates = HabitDates()
+        self.rebuild()
+
+    def rebuild(self):
+        """Re-index every habit, e.g. after the list was replaced"""
+        self.by_id = {habit["id"]: habit for habit in self.all()}
+        self.dates.rebuild(self.all())
+
+    def all(self):
+        return self.data["user"]["habits"]
+
+    def get(self, habit_id):
+        """Habit with the given id, or None"""
+        return self.by_id.get(habit_id)
+
+    def active(self):
+        return [h for h in self.all() if h["active"]]
+
+    def inactive(self):
+        return [h for h in self.all() if not h["active"]]
+
+    def completions(self, habit_id):
+        """HabitCompletions of a habit"""
+        return self.dates.get(habit_id)
+
+    def done_on(self, habit_id, day):
+        """Whether the habit was completed on a date"""
+        return day.toordinal() in self.dates.get(habit_id)
+
+    def streak(self, habit_id, day):
+        """Current streak of a habit as of a date"""
+        return self.dates.get(habit_id).current_streak(day.toordinal())
+
+    def apply(self, event):
+        kind = event["type"]
+        if kind == "habit_added":
+            self.by_id[event["habit"]["id"]] = event["habit"]
+        elif kind == "habit_deleted":
+            self.by_id.pop(event["id"], None)
+        self.dates.apply(event, self.get)
+
+
+# ===== Engines =====
+# Accounting rules with no UI attached. Engines describe changes as
+# (event_type, payload) pairs that the caller records or applies.
+
+MIN_SESSION_SECONDS = 60
+XP_PER_MINUTE = 10
+TASK_XP_PER_PRIORITY = 25
+HABIT_XP = 15
+LEVEL_XP = 1000
+
+
+class LevelCurve(ABC):
+    """XP needed to finish each level
+    
+    total(level) is the XP earned from the start of level 1 to the start
+    of level, so a user's standing is the single number total(level) + xp.
+    Subclasses give needed() and closed forms for total() and level_for().
+    """
+
+    @abstractmethod
+    def needed(self, level):
+        """XP needed to finish level"""
+
+    def total(self, level):
+        return sum(self.needed(n) for n in range(1, level))
+
+    def level_for(self, total):
+        """Highest level whose start is at most total XP"""
+        # Gallop then bisect, total() grows with the level
+        high = 2
+        while self.total(high) <= total:
+            high *= 2
+        low = high // 2
+        while high - low > 1:
+            mid = (low + high) // 2
+            if self.total(mid) <= total:
+                low = mid
+            else:
+                high = mid
+        return low
+
+
+class LinearCurve(LevelCurve):
+    """Level n needs n * step XP"""
+
+    def __init__(self, step=LEVEL_XP):
+        self.step = step
+
+    def needed(self, level):
+        return level * self.step
+
+    def total(self, level):
+        return self.step * level * (level - 1) // 2
+
+    def level_for(self, total):
+        # Largest n with n * (n - 1) <= 2 * total / step
+        return (math.isqrt(4 * (2 * total // self.step) + 1) + 1) // 2
+
+
+class FlatCurve(LevelCurve):
+    """Every level needs the same XP"""
+
+    def __init__(self, step=LEVEL_XP):
+        self.step = step
+
+    def needed(self, level):
+        return self.step
+
+    def total(self, level):
+        return (level - 1) * self.step
+
+    def level_for(self, total):
+        return total // self.step + 1
+
+
+class QuadraticCurve(LevelCurve):
+    """Level n needs n * n * step XP, for slower progress at high levels"""
+
+    def __init__(self, step=LEVEL_XP // 4):
+        self.step = step
+
+    def needed(self, level):
+        return level * level * self.step
+
+    def total(self, level):
+        return self.step * (level - 1) * level * (2 * level - 1) // 6
+
+
+LEVEL_CURVES = {
+    "linear": LinearCurve(),
+    "flat": FlatCurve(),
+    "quadratic": QuadraticCurve()
+}
+
+
+class ProgressEngine:
+    """XP, level and streak rules"""
+
+    def __init__(self, settings=None):
+        self.settings = settings if settings is not None else {}
+
+    @property
+    def curve(self):
+        """LevelCurve chosen by the level_curve setting"""
+        return LEVEL_CURVES.get(self.settings.get("level_curve"), LEVEL_CURVES["linear"])
+
+    def session_xp(self, seconds):
+        return seconds // 60 * XP_PER_MINUTE
+
+    def task_xp(self, task):
+        return task.get("priority", 1) * TASK_XP_PER_PRIORITY
+
+    def habit_xp(self, habit):
+        return HABIT_XP
+
+    def xp_needed(self, level):
+        """XP needed to finish a level"""
+        return self.curve.needed(level)
+
+    def level_up(self, user):
+        """level_changed event for every level the user's XP covers, else None"""
+        curve = self.curve
+        total = curve.total(user["level"]) + user["xp"]
+        level = curve.level_for(total)
+        if level <= user["level"]:
+            return None
+        return "level_changed", {"level": level, "xp": total - curve.total(level)}
+
+    def streak(self, user, now):
+        """streak_updated event for a session finished at now"""
+        today = now.date()
+        last_session = parse_timestamp(user["last_session"]).date() if user["last_session"] else None
+        
+        streak = user["streak"]
+        if last_session == today:
+            pass  # Already updated today
+        elif last_session is None or (today - last_session).days == 1:
+            streak += 1
+        else:
+            streak = 1
+        return "streak_updated", {"streak": streak, "last_session": now.isoformat()}
+
+
+# (id, title, test on the user dict), checked after every credited session
+ACHIEVEMENTS = (
+    ("first_session", "First Session", lambda user: user["sessions"] >= 1),
+    ("sessions_10", "10 Sessions", lambda user: user["sessions"] >= 10),
+    ("sessions_100", "100 Sessions", lambda user: user["sessions"] >= 100),
+    ("hours_10", "10 Hours Focused", lambda user: user["total_seconds"] >= 10 * 3600),
+    ("hours_100", "100 Hours Focused", lambda user: user["total_seconds"] >= 100 * 3600),
+    ("streak_7", "7 Day Streak", lambda user: user["streak"] >= 7),
+    ("streak_30", "30 Day Streak", lambda user: user["streak"] >= 30),
+)
+
+
+class SessionEngine:
+    """Session crediting and pomodoro phase rules"""
+
+    def __init__(self, progress):
+        self.progress = progress
+
+    def credit(self, seconds):
+        """session_completed event for a finished session, None if too short"""
+        if seconds < MIN_SESSION_SECONDS:
+            return None
+        return "session_completed", {"seconds": seconds, "xp": self.progress.session_xp(seconds)}
+
+    def credit_time(self, seconds):
+        """time_credited event for an interrupted session, None if too short"""
+        if seconds < MIN_SESSION_SECONDS:
+            return None
+        return "time_credited", {"seconds": seconds}
+
+    def next_phase(self, phase, cycles_completed, settings):
+        """(phase, seconds, title) of the pomodoro phase after phase"""
+        if phase == "focus":
+            if cycles_completed % settings["pomodoro_cycles"] == 0:
+                return "long_break", settings["long_break"] * 60, "Long Break"
+            return "short_break", settings["short_break"] * 60, "Short Break"
+        title = f"Focus Session {cycles_completed + 1} of {settings['pomodoro_cycles']}"
+        return "focus", settings["focus_duration"] * 60, title
+
+
+class SessionPipeline:
+    """Ordered stages run once for every finished session
+    
+    A stage is called as stage(session, emit) where session is a dict
+    describing the session and emit records an event. Returning False
+    stops the pipeline, e.g. for a session too short to count. Once the
+    stages have committed the session, the post-commit stages are called
+    as stage(session), for work such as notifications that changes no
+    data, and then every subscriber is called with the session.
+    """
+
+    def __init__(self):
+        # (name, stage) in run order
+        self.stages = []
+        self.post_stages = []
+        self.subscribers = []
+
+    def add_stage(self, name, stage, before=None, post_commit=False):
+        """Add a stage at the end, or before the named one"""
+        stages = self.post_stages if post_commit else self.stages
+        index = len(stages)
+        if before is not None:
+            index = [n for n, s in stages].index(before)
+        stages.insert(index, (name, stage))
+
+    def remove_stage(self, name):
+        self.stages = [(n, s) for n, s in self.stages if n != name]
+        self.post_stages = [(n, s) for n, s in self.post_stages if n != name]
+
+    def subscribe(self, callback):
+        """Call callback(session) after every committed session"""
+        self.subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self.subscribers:
+            self.subscribers.remove(callback)
+
+    def run(self, session, emit, lock=None):
+        """Run the stages, returns False if one of them stopped the session
+        
+        lock, if given, is held while the stages commit the session and
+        released before the post-commit stages and subscribers run.
+        """
+        with lock if lock is not None else nullcontext():
+            for name, stage in self.stages:
+                if stage(session, emit) is False:
+                    return False
+        for name, stage in self.post_stages:
+            stage(session)
+        for callback in list(self.subscribers):
+            callback(session)
+        return True
+
+
+def new_session(mode, seconds, now, started=None, task=None, notes=""):
+    """Session dict passed through a SessionPipeline"""
+    return {
+        "mode": mode,
+        "seconds": seconds,
+        "now": now,
+        "started": started if started is not None else now.timestamp() - seconds,
+        "task": task,
+        "notes": notes,
+        "leveled": 0,
+        "achievements": []
+    }
+
+
+class FocusCore:
+    """Data tree with its stores and engines, usable without a UI
+    
+    Methods that change data take an emit(event_type, payload) callback
+    and call it once per event, in order, expecting the event to be
+    applied before it returns. The app records through its storage,
+    headless callers can pass apply_payload.
+    """
+
+    def __init__(self, data, sessions=None, archive=None):
+        self.data = data
+        self.sessions = sessions if sessions is not None else SessionStore()
+        # TaskArchive with the tasks archived out of data, None to keep them all
+        self.archive = archive
+        self.tasks = TaskStore(data)
+        self.habits = HabitStore(data)
+        self.progress = ProgressEngine(data["settings"])
+        self.session_engine = SessionEngine(self.progress)
+        # Built on the first search, then kept current by apply()
+        self._search = None
+        # Built on the first search of the archive, dropped when it grows
+        self._archive_search = None
+        
+        self.session_pipeline = SessionPipeline()
+        self.session_pipeline.add_stage("accounting", self.credit_session)
+        self.session_pipeline.add_stage("notes", self.attach_notes)
+        self.session_pipeline.add_stage("streak", self.advance_streak)
+        self.session_pipeline.add_stage("achievements", self.unlock_achievements)
+
+    def apply(self, event):
+        """Apply an event to the data and the stores"""
+        apply_event(self.data, event, self.find)
+        if event["type"] == "sessions_imported":
+            self.sessions.add_many(event["sessions"])
+        self.tasks.apply(event)
+        self.habits.apply(event)
+        if self._search is not None:
+            self._search.apply(event, self.tasks)
+
+    def find(self, section, item_id):
+        """Task or habit by id through the stores' indexes"""
+        return (self.tasks if section == "tasks" else self.habits).get(item_id)
+
+    @property
+    def search_index(self):
+        """SearchIndex over the tasks, built on first use"""
+        if self._search is None:
+            self._search = SearchIndex()
+            self._search.rebuild(self.tasks.all())
+        return self._search
+
+    def search(self, query, limit=50, archived=False):
+        """(score, document) pairs best matching query, see SearchIndex
+        
+        With archived, archived tasks are searched too, which reads
+        every archive segment the first time.
+        """
+        results = self.search_index.search(query, limit)
+        if archived and self.archive is not None:
+            if self._archive_search is None:
+                self._archive_search = SearchIndex()
+                self._archive_search.rebuild(self.archived_tasks())
+            results = heapq.nlargest(limit, results + self._archive_search.search(query, limit), key=itemgetter(0))
+        return results
+
+    def completed_between(self, start_date=None, end_date=None):
+        """Live and archived tasks completed within the date range
+        
+        Only the archive segments of months in the range are read.
+        """
+        return self.archived_tasks(start_date, end_date) + self.tasks.completed_between(start_date, end_date)
+
+    def archived_tasks(self, start_date=None, end_date=None):
+        """Archived tasks completed within the date range"""
+        archived = self.data["archived"]
+        if self.archive is None or not archived:
+            return []
+        # A segment written just before a crash may hold tasks still in the data
+        return [task for task in self.archive.tasks_between(start_date, end_date) if task["id"] in archived]
+
+    def archived_task(self, task_id):
+        """Archived task by id, or None"""
+        month = self.data["archived"].get(task_id)
+        if month is None or self.archive is None:
+            return None
+        return self.archive.get(month, task_id)
+
+    def apply_payload(self, event_type, payload):
+        """emit callback that applies events without persisting them"""
+        self.apply({"type": event_type, "day": date.today().isoformat(), **payload})
+
+    def level_up(self, emit):
+        """Emit a level change if one is due, returns the number of levels gained"""
+        level = self.data["user"]["level"]
+        event = self.progress.level_up(self.data["user"])
+        if event is None:
+            return 0
+        emit(*event)
+        return event[1]["level"] - level
+
+    def commit_session(self, session, emit, lock=None):
+        """Run a finished session through the pipeline, returns True if it counted"""
+        return self.session_pipeline.run(session, emit, lock)
+
+    # Session pipeline stages
+    def credit_session(self, session, emit):
+        event = self.session_engine.credit(session["seconds"])
+        if event is None:
+            return False
+        emit(*event)
+        session["leveled"] = self.level_up(emit)
+
+    def attach_notes(self, session, emit):
+        if session["notes"] and session["task"]:
+            emit("task_note_added", {
+                "id": session["task"]["id"],
+                "note": {"date": session["now"].isoformat(), "content": session["notes"]}
+            })
+
+    def advance_streak(self, session, emit):
+        emit(*self.progress.streak(self.data["user"], session["now"]))
+
+    def unlock_achievements(self, session, emit):
+        user = self.data["user"]
+        unlocked = {a["id"] for a in user["achievements"]}
+        for achievement_id, title, test in ACHIEVEMENTS:
+            if achievement_id not in unlocked and test(user):
+                achievement = {"id": achievement_id, "title": title, "date": session["now"].isoformat()}
+                emit("achievement_unlocked", {"achievement": achievement})
+                session["achievements"].append(achievement)
+
+    def toggle_task(self, task, completed, now, emit):
+        """Mark a task done or not, returns the number of levels gained"""
+        emit("task_toggled", {"id": task["id"], "completed": completed, "date": now.isoformat()})
+        if not completed:
+            return 0
+        emit("xp_awarded", {"amount": self.progress.task_xp(task)})
+        return self.level_up(emit)
+
+    def toggle_habit(self, habit, done, day, emit):
+        """Mark a habit done or not on a day, returns the number of levels gained"""
+        if done == self.habits.done_on(habit["id"], day):
+            return 0
+        if not done:
+            emit("habit_completion_removed", {"id": habit["id"], "date": day.isoformat()})
+            return 0
+        emit("habit_completion_added", {"id": habit["id"], "date": day.isoformat()})
+        emit("xp_awarded", {"amount": self.progress.habit_xp(habit)})
+        return self.level_up(emit)
+
+    def archive_tasks(self, today, emit):
+        """Move tasks completed archive_after_days before today to the archive
+        
+        The segments are written before the event is emitted, so tasks
+        stay in the data until their copy is on disk. Returns how many
+        tasks were archived.
+        """
+        days = self.data["settings"].get("archive_after_days", 0)
+        if not days or self.archive is None:
+            return 0
+        months = self.tasks.archivable(today - timedelta(days=days))
+        if not months:
+            return 0
+        for month, tasks in sorted(months.items()):
+            self.archive.add(month, tasks)
+        emit("tasks_archived", {"months": {month: [task["id"] for task in tasks] for month, tasks in months.items()}})
+        self._archive_search = None
+        return sum(len(tasks) for tasks in months.values())
+
+    def daily_reset(self, now, emit):
+        """Record the first start of a new day"""
+        user = self.data["user"]
+        last_reset = parse_timestamp(user["last_reset"]).date() if user["last_reset"] else None
+        if last_reset != now.date():
+            emit("user_changed", {"key": "last_reset", "value": now.isoformat()})
@@ -0,0 +1,406 @@
+import json
+import os
+import re
+import threading
+from datetime import date, datetime
+
+from focusflick_core import SessionStore, default_data, ensure_fields
+
+CHUNK_SIZE = 1 << 16
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+# Characters a number may still continue with, up to the end of the buffer
+NUMBER_TAIL = re.compile(r"[0-9.eE+-]*\Z")
+# Invalid records reported in detail, the rest are only counted
+MAX_REPORTED_ERRORS = 20
+
+# Field -> (accepted types, required) of the records in an export file
+TASK_FIELDS = {
+    "id": (str, False),
+    "name": (str, True),
+    "priority": (int, False),
+    "completed": (bool, False),
+    "created": (str, False),
+    "completed_date": (str, False),
+    "due_date": (str, False),
+    "description": (str, False),
+    "notes": (list, False)
+}
+NOTE_FIELDS = {
+    "date": (str, True),
+    "content": (str, True)
+}
+HABIT_FIELDS = {
+    "id": (str, False),
+    "name": (str, True),
+    "description": (str, False),
+    "created": (str, False),
+    "active": (bool, False),
+    "completions": (list, False)
+}
+ACHIEVEMENT_FIELDS = {
+    "id": (str, True),
+    "title": (str, False),
+    "date": (str, False)
+}
+USER_FIELDS = {
+    "name": (str, False),
+    "streak": (int, False),
+    "total_seconds": (int, False),
+    "sessions": (int, False),
+    "last_session": ((str, type(None)), False),
+    "daily_goal": (int, False),
+    "xp": (int, False),
+    "level": (int, False),
+    "last_reset": ((str, type(None)), False)
+}
+# Types a session row number may have
+NUMBER_TYPES = (int, float)
+# Fields holding timestamps that the stats and streaks parse
+TIMESTAMP_FIELDS = ("created", "completed_date", "due_date", "date", "last_session", "last_reset")
+
+
+class ImportFormatError(ValueError):
+    """The file is not a FocusFlick export"""
+
+
+class JsonStream:
+    """Reads a JSON document from a file one value at a time
+    
+    Objects and arrays can be walked with items() and elements(), reading
+    each member with value() or walking into it, so a large export never
+    has to be held as text and as parsed data at the same time.
+    """
+
+    def __init__(self, f, size):
+        self.f = f
+        self.size = max(1, size)
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.consumed = 0  # Characters dropped from the front of the buffer
+        self.eof = False
+
+    def fraction(self):
+        """Rough share of the file read so far"""
+        return min(1.0, (self.consumed + self.pos) / self.size)
+
+    def _fill(self):
+        chunk = self.f.read(CHUNK_SIZE)
+        if not chunk:
+            self.eof = True
+            return False
+        self.consumed += self.pos
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Next character after any whitespace, '' at the end of the file"""
+        while True:
+            self.pos = WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char):
+        found = self.peek()
+        if found != char:
+            raise ImportFormatError(f"Expected {char!r} but found {found!r} at character {self.consumed + self.pos}")
+        self.pos += 1
+
+    def value(self):
+        """Parse the next complete value"""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError as e:
+                # Most likely cut off by the end of the buffer
+                if not self._fill():
+                    raise ImportFormatError(f"Invalid JSON at character {self.consumed + e.pos}") from e
+                continue
+            # A number cut off by the end of the buffer, even after "1." or "1e",
+            # may continue in the next chunk
+            if NUMBER_TAIL.match(self.buffer, end) and not self.eof and self._fill():
+                continue
+            self.pos = end
+            return value
+
+    def items(self):
+        """Yield the keys of an object, the caller reads or walks each value"""
+        self.expect("{")
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            key = self.value()
+            if not isinstance(key, str):
+                raise ImportFormatError(f"Expected a key at character {self.consumed + self.pos}")
+            self.expect(":")
+            yield key
+            if self.peek() == "}":
+                self.pos += 1
+                return
+            self.expect(",")
+
+    def elements(self):
+        """Yield once per array element, the caller reads or walks each one"""
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield
+            if self.peek() == "]":
+                self.pos += 1
+                return
+            self.expect(",")
+
+
+def _type_names(types):
+    types = types if isinstance(types, tuple) else (types,)
+    return " or ".join("null" if t is type(None) else t.__name__ for t in types)
+
+
+def _valid_timestamp(text):
+    try:
+        datetime.fromisoformat(text)
+        return True
+    except ValueError:
+        return False
+
+
+class Validator:
+    """Checks records against the field tables, collecting readable errors"""
+
+    def __init__(self):
+        self.errors = []
+        self.skipped = 0
+
+    def error(self, message):
+        self.skipped += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(message)
+
+    def record(self, record, fields, path):
+        """True if record is a dict whose known fields have the right types"""
+        if not isinstance(record, dict):
+            self.error(f"{path}: expected an object")
+            return False
+        for key, (types, required) in fields.items():
+            if key not in record:
+                if required:
+                    self.error(f"{path}: missing {key}")
+                    return False
+            # bool is an int, but an int is never a valid bool
+            elif not isinstance(record[key], types) or (types is int and isinstance(record[key], bool)):
+                self.error(f"{path}.{key}: expected {_type_names(types)}")
+                return False
+            elif key in TIMESTAMP_FIELDS and isinstance(record[key], str) and not _valid_timestamp(record[key]):
+                self.error(f"{path}.{key}: not an ISO date")
+                return False
+        return True
+
+    def task(self, task, path):
+        if not self.record(task, TASK_FIELDS, path):
+            return None
+        notes = []
+        for i, note in enumerate(task.get("notes", [])):
+            if self.record(note, NOTE_FIELDS, f"{path}.notes[{i}]"):
+                notes.append(note)
+        if "notes" in task:
+            task["notes"] = notes
+        return task
+
+    def habit(self, habit, path):
+        if not self.record(habit, HABIT_FIELDS, path):
+            return None
+        completions = []
+        for i, day in enumerate(habit.get("completions", [])):
+            try:
+                completions.append(date.fromisoformat(day).isoformat())
+            except (TypeError, ValueError):
+                self.error(f"{path}.completions[{i}]: not an ISO date")
+        habit["completions"] = sorted(set(completions))
+        habit.setdefault("active", True)
+        return habit
+
+    def session(self, row, path):
+        """(start, end, mode, task, duration) tuple, or None"""
+        if type(row) is list and len(row) == 5:
+            start, end, mode, task, duration = row
+            # type() rather than isinstance() so true and false are not numbers
+            if (
+                type(start) in NUMBER_TYPES and type(end) in NUMBER_TYPES and type(duration) in NUMBER_TYPES
+                and mode in SessionStore.MODES
+                and (task is None or type(task) is str)
+                and duration >= 0
+            ):
+                return float(start), float(end), mode, task or None, int(duration)
+        self.error(f"{path}: expected [start, end, mode, task, seconds]")
+        return None
+
+
+def read_export(path, progress=None):
+    """Parse and validate an export file
+    
+    Returns a dict with the imported "data" tree (missing fields filled
+    from the defaults), "sessions" rows or None when the file has no
+    session history, "counts" per record type, and "errors"/"skipped"
+    for the invalid records that were left out. progress is called with
+    the share of the file read so far.
+    """
+    data = default_data()
+    sessions = None
+    counts = {"tasks": 0, "habits": 0, "sessions": 0}
+    check = Validator()
+    settings_types = {key: type(value) for key, value in data["settings"].items()}
+
+    def report(stream):
+        if progress is not None:
+            progress(stream.fraction())
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        stream = JsonStream(f, os.path.getsize(path))
+        if stream.peek() != "{":
+            raise ImportFormatError("Not a FocusFlick export, expected a JSON object")
+        
+        for key in stream.items():
+            if key == "user" and stream.peek() == "{":
+                user = data["user"]
+                for field in stream.items():
+                    if field in ("tasks", "habits") and stream.peek() == "[":
+                        records = user[field]
+                        validate = check.task if field == "tasks" else check.habit
+                        for i, _ in enumerate(stream.elements()):
+                            record = validate(stream.value(), f"user.{field}[{i}]")
+                            if record is not None:
+                                records.append(record)
+                                counts[field] += 1
+                            report(stream)
+                    elif field == "achievements":
+                        value = stream.value()
+                        achievements = value if isinstance(value, list) else []
+                        user[field] = [a for i, a in enumerate(achievements)
+                                       if check.record(a, ACHIEVEMENT_FIELDS, f"user.achievements[{i}]")]
+                    else:
+                        value = stream.value()
+                        if field in USER_FIELDS and not check.record({field: value}, {field: USER_FIELDS[field]}, "user"):
+                            continue
+                        user[field] = value
+            elif key == "settings" and stream.peek() == "{":
+                for field in stream.items():
+                    value = stream.value()
+                    expected = settings_types.get(field)
+                    if expected is not None and type(value) is not expected:
+                        check.error(f"settings.{field}: expected {expected.__name__}")
+                        continue
+                    data["settings"][field] = value
+            elif key == "sessions" and stream.peek() == "[":
+                sessions = []
+                for i, _ in enumerate(stream.elements()):
+                    row = check.session(stream.value(), f"sessions[{i}]")
+                    if row is not None:
+                        sessions.append(row)
+                        counts["sessions"] += 1
+                    if i % 256 == 0:
+                        report(stream)
+            else:
+                # Derived or device-specific (rollup, log_seq, sync), rebuilt here
+                stream.value()
+        
+        if stream.peek() != "":
+            raise ImportFormatError("Unexpected data after the export")
+    
+    ensure_fields(data)
+    if progress is not None:
+        progress(1.0)
+    return {"data": data, "sessions": sessions, "counts": counts, "errors": check.errors, "skipped": check.skipped}
+
+
+def merge_events(data, sessions, imported):
+    """Events that add what an import has and data lacks
+    
+    Tasks, habits and achievements are matched by id, notes by date and
+    text, habit completions by day and sessions by start time and mode.
+    Anything already present, or archived, is left as it is.
+    """
+    events = []
+    user = imported["data"]["user"]
+    now = datetime.now().isoformat()
+    archived = data.get("archived", {})
+    
+    tasks = {task["id"]: task for task in data["user"]["tasks"]}
+    for task in user["tasks"]:
+        if task["id"] in archived:
+            continue
+        current = tasks.get(task["id"])
+        known = set()
+        if current is None:
+            # Notes and completion go through their own events, as when recorded
+            added = {k: v for k, v in task.items() if k not in ("notes", "completed", "completed_date")}
+            added["completed"] = False
+            events.append(("task_added", {"task": added}))
+            if task.get("completed"):
+                completed_date = task.get("completed_date") or task.get("created") or now
+                events.append(("task_toggled", {"id": task["id"], "completed": True, "date": completed_date}))
+        else:
+            known = {(note["date"], note["content"]) for note in current.get("notes", [])}
+        for note in task.get("notes", []):
+            if (note["date"], note["content"]) not in known:
+                known.add((note["date"], note["content"]))
+                events.append(("task_note_added", {"id": task["id"], "note": note}))
+    
+    habits = {habit["id"]: habit for habit in data["user"]["habits"]}
+    for habit in user["habits"]:
+        current = habits.get(habit["id"])
+        if current is None:
+            events.append(("habit_added", {"habit": {**habit, "completions": []}}))
+            known = set()
+        else:
+            known = set(current.get("completions", []))
+        for day in habit["completions"]:
+            if day not in known:
+                events.append(("habit_completion_added", {"id": habit["id"], "date": day}))
+    
+    unlocked = {a.get("id") for a in data["user"]["achievements"] if isinstance(a, dict)}
+    for achievement in user["achievements"]:
+        if achievement["id"] not in unlocked:
+            unlocked.add(achievement["id"])
+            events.append(("achievement_unlocked", {"achievement": achievement}))
+    
+    if imported["sessions"]:
+        known = {(round(start, 3), mode) for start, end, mode, task, duration in sessions.sessions()}
+        by_day = {}
+        for row in imported["sessions"]:
+            key = (round(row[0], 3), row[2])
+            if key not in known:
+                known.add(key)
+                by_day.setdefault(date.fromtimestamp(row[0]).isoformat(), []).append(list(row))
+        for day in sorted(by_day):
+            events.append(("sessions_imported", {"day": day, "sessions": by_day[day]}))
+    return events
+
+
+class ImportWorker(threading.Thread):
+    """Reads and validates an export file off the UI thread
+    
+    The UI polls progress and is_alive(), then takes result or error.
+    """
+
+    def __init__(self, path):
+        super().__init__(daemon=True)
+        self.path = path
+        self.progress = 0.0
+        self.result = None
+        self.error = None
+
+    def run(self):
+        try:
+            self.result = read_export(self.path, self.set_progress)
+        except Exception as e:
+            self.error = e
+
+    def set_progress(self, fraction):
+        self.progress = fraction
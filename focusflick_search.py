@@ -0,0 +1,229 @@
+import heapq
+import math
+import re
+from bisect import bisect_left
+from collections import Counter
+from operator import itemgetter
+
+TOKEN_RE = re.compile(r"\w+")
+# Prefix matches score lower than the word itself
+PREFIX_WEIGHT = 0.5
+# Completions tried per prefix, shortest first, so one letter stays fast
+MAX_EXPANSIONS = 32
+# Task fields searched besides the notes, with how much a match counts
+FIELD_WEIGHTS = {"name": 2.0, "description": 1.0}
+
+
+def tokenize(text):
+    """Lowercase words of a text"""
+    return TOKEN_RE.findall(text.casefold())
+
+
+def snippet(text, terms, width=80):
+    """Part of text around the first word starting with one of the terms"""
+    text = " ".join(text.split())
+    if len(text) <= width:
+        return text
+    start = 0
+    for match in TOKEN_RE.finditer(text.casefold()):
+        if match.group().startswith(tuple(terms)):
+            start = max(0, match.start() - width // 4)
+            break
+    end = min(len(text), start + width)
+    start = max(0, end - width)
+    return ("…" if start else "") + text[start:end] + ("…" if end < len(text) else "")
+
+
+class SearchIndex:
+    """Inverted index over task names, descriptions and notes
+    
+    Every document is one field of a task or one of its notes. The
+    index is kept current from the same events as the data tree, and
+    queries match every term as a word prefix so results show up while
+    the user is still typing.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        # doc id -> {"task_id", "kind", "note", "date", "text"}
+        self.docs = {}
+        # doc id -> {token: count}, for removal
+        self.doc_tokens = {}
+        # token -> {doc id: count times the field weight}
+        self.postings = {}
+        # Word length -> sorted tokens of that length, for prefix lookups.
+        # May hold tokens that no longer have postings.
+        self.vocabulary = {}
+        # task id -> doc ids
+        self.task_docs = {}
+        self.next_doc = 0
+
+    def rebuild(self, tasks):
+        """Index every task, oldest document first so doc ids follow dates"""
+        self.clear()
+        documents = []
+        for task in tasks:
+            documents.extend(self.task_documents(task))
+        documents.sort(key=itemgetter(3))
+        
+        # Sort the vocabulary once instead of inserting each new word
+        self.vocabulary = None
+        for document in documents:
+            self._add(*document)
+        self.vocabulary = {}
+        for token in sorted(self.postings):
+            self.vocabulary.setdefault(len(token), []).append(token)
+
+    def task_documents(self, task):
+        """(task id, kind, note index, date, text) of every field and note of a task"""
+        documents = []
+        for kind in FIELD_WEIGHTS:
+            if task.get(kind):
+                documents.append((task["id"], kind, None, task.get("created", ""), task[kind]))
+        for index, note in enumerate(task.get("notes", [])):
+            documents.append((task["id"], "note", index, note.get("date", ""), note.get("content", "")))
+        return documents
+
+    def add_task(self, task):
+        for document in self.task_documents(task):
+            self._add(*document)
+
+    def remove_task(self, task_id, kinds=None):
+        """Drop a task's documents, or only those of the given kinds"""
+        kept = []
+        for doc_id in self.task_docs.pop(task_id, []):
+            if kinds is None or self.docs[doc_id]["kind"] in kinds:
+                self._remove(doc_id)
+            else:
+                kept.append(doc_id)
+        if kept:
+            self.task_docs[task_id] = kept
+
+    def _add(self, task_id, kind, note, date, text):
+        counts = Counter(tokenize(text))
+        if not counts:
+            return
+        
+        doc_id = self.next_doc
+        self.next_doc += 1
+        self.docs[doc_id] = {
+            "task_id": task_id,
+            "kind": kind,
+            "note": note,
+            "date": date,
+            "text": text
+        }
+        self.doc_tokens[doc_id] = counts
+        self.task_docs.setdefault(task_id, []).append(doc_id)
+        weight = FIELD_WEIGHTS.get(kind, 1.0)
+        all_postings = self.postings
+        for token, count in counts.items():
+            postings = all_postings.get(token)
+            if postings is None:
+                postings = all_postings[token] = {}
+                if self.vocabulary is not None:
+                    self._add_word(token)
+            postings[doc_id] = count * weight
+
+    def _add_word(self, token):
+        words = self.vocabulary.setdefault(len(token), [])
+        index = bisect_left(words, token)
+        if index == len(words) or words[index] != token:
+            words.insert(index, token)
+
+    def _remove(self, doc_id):
+        del self.docs[doc_id]
+        for token in self.doc_tokens.pop(doc_id):
+            postings = self.postings[token]
+            del postings[doc_id]
+            if not postings:
+                # The vocabulary entry is skipped until the token comes back
+                del self.postings[token]
+
+    def apply(self, event, tasks):
+        """Bring the index up to date with an event already applied to the tasks
+        
+        tasks is the TaskStore the event was applied to.
+        """
+        kind = event["type"]
+        if kind == "task_added":
+            self.add_task(event["task"])
+        elif kind == "task_updated":
+            changed = set(event.get("fields", {})) | set(event.get("removed", []))
+            fields = changed & set(FIELD_WEIGHTS)
+            if fields:
+                self.remove_task(event["id"], fields)
+                task = tasks.get(event["id"])
+                if task is not None:
+                    for field in fields:
+                        if task.get(field):
+                            self._add(task["id"], field, None, task.get("created", ""), task[field])
+        elif kind == "task_note_added":
+            task = tasks.get(event["id"])
+            if task is not None:
+                index = len(task.get("notes", [])) - 1
+                self._add(task["id"], "note", index, event["note"].get("date", ""), event["note"].get("content", ""))
+        elif kind == "task_deleted":
+            self.remove_task(event["id"])
+        elif kind == "tasks_archived":
+            for ids in event["months"].values():
+                for task_id in ids:
+                    self.remove_task(task_id)
+
+    def expand(self, term):
+        """Indexed tokens starting with term, at most MAX_EXPANSIONS of the shortest"""
+        tokens = []
+        upper = term + "\U0010ffff"
+        for length in sorted(n for n in self.vocabulary if n >= len(term)):
+            words = self.vocabulary[length]
+            start = bisect_left(words, term)
+            for token in words[start:bisect_left(words, upper, start)]:
+                if token in self.postings:
+                    tokens.append(token)
+                    if len(tokens) == MAX_EXPANSIONS:
+                        return tokens
+        return tokens
+
+    def search(self, query, limit=50):
+        """Best matching documents as (score, doc) pairs, every term must match"""
+        terms = tokenize(query)
+        if not terms:
+            return []
+        
+        # Narrow down with the rarest term first
+        expanded = sorted(
+            ((term, self.expand(term)) for term in terms),
+            key=lambda item: sum(len(self.postings[token]) for token in item[1])
+        )
+        total = len(self.docs)
+        scores = None
+        for term, tokens in expanded:
+            matched = {}
+            for token in tokens:
+                postings = self.postings[token]
+                weight = math.log(1 + total / len(postings))
+                if token != term:
+                    weight *= PREFIX_WEIGHT
+                if scores is not None and len(postings) > len(scores):
+                    # Look up the remaining candidates instead of the long list
+                    postings = {doc_id: postings[doc_id] for doc_id in scores if doc_id in postings}
+                elif scores is not None:
+                    postings = {doc_id: count for doc_id, count in postings.items() if doc_id in scores}
+                if not matched:
+                    matched = {doc_id: count * weight for doc_id, count in postings.items()}
+                else:
+                    get = matched.get
+                    for doc_id, count in postings.items():
+                        matched[doc_id] = get(doc_id, 0) + count * weight
+            if scores is None:
+                scores = matched
+            else:
+                scores = {doc_id: scores[doc_id] + score for doc_id, score in matched.items()}
+            if not scores:
+                return []
+        
+        # Ties go to the higher doc id, which is the newer document
+        best = heapq.nlargest(limit, scores.items(), key=itemgetter(1, 0))
+        return [(score, self.docs[doc_id]) for doc_id, score in best]
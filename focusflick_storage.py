@@ -0,0 +1,891 @@
+import csv
+import glob
+import gzip
+import json
+import os
+import threading
+import time
+from focusflick_core import SessionStore, apply_event, default_data, event_registers, find_by_id, migrate_data, rollup_day
+
+
+def _fsync_dir(path):
+    """Persist a rename on filesystems that need the directory synced"""
+    if os.name == "nt":
+        return
+    fd = os.open(path or ".", os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class SnapshotStore:
+    """Atomic JSON snapshots with rotated backup generations"""
+
+    def __init__(self, path, generations=3):
+        self.path = path
+        self.generations = generations
+        self.written_seq = -1
+        # log_seq of each generation newest first, None where there is none
+        self._seqs = None
+        self._lock = threading.Lock()
+
+    def generation_paths(self):
+        """Snapshot paths from newest to oldest"""
+        return [self.path] + [f"{self.path}.{i}" for i in range(1, self.generations + 1)]
+
+    def load(self):
+        """Load the newest snapshot that parses, or None if there is none"""
+        for path in self.generation_paths():
+            if not os.path.exists(path):
+                continue
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if path != self.path:
+                    print(f"Recovered data from backup {path}")
+                return data
+            except Exception as e:
+                print(f"Error loading snapshot {path}: {e}")
+        return None
+
+    def _read_seq(self, path):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f).get("log_seq", 0)
+        except Exception:
+            # Missing or unreadable, it can't be restored from
+            return None
+
+    def _generation_seqs(self):
+        """log_seq of each generation, read from disk the first time"""
+        if self._seqs is None:
+            self._seqs = [self._read_seq(path) for path in self.generation_paths()]
+        return self._seqs
+
+    def oldest_seq(self):
+        """Lowest log_seq among the kept generations, events after it are still needed"""
+        with self._lock:
+            seqs = [seq for seq in self._generation_seqs() if seq is not None]
+            return min(seqs) if seqs else 0
+
+    def write(self, text, seq=0):
+        """Durably replace the snapshot, skipping writes older than the last one"""
+        with self._lock:
+            if seq < self.written_seq:
+                return False
+            
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(text)
+                f.flush()
+                os.fsync(f.fileno())
+            
+            seqs = self._generation_seqs()
+            self._rotate()
+            os.replace(tmp_path, self.path)
+            _fsync_dir(os.path.dirname(self.path))
+            seqs[0] = seq
+            self.written_seq = seq
+            return True
+
+    def _rotate(self):
+        """Shift existing snapshots one generation back"""
+        paths = self.generation_paths()
+        for i in range(len(paths) - 1, 0, -1):
+            if os.path.exists(paths[i - 1]):
+                os.replace(paths[i - 1], paths[i])
+                self._seqs[i] = self._seqs[i - 1]
+
+
+class EventLog:
+    """Append-only log of data mutations, one JSON object per line"""
+
+    def __init__(self, path):
+        self.path = path
+        self.count = 0  # Events written since the last compaction
+        self._file = None
+
+    def sealed_segments(self):
+        """Sealed segment paths ordered by the last sequence number they hold"""
+        segments = []
+        for path in glob.glob(glob.escape(self.path) + ".*"):
+            suffix = path.rsplit(".", 1)[1]
+            if suffix.isdigit():
+                segments.append((int(suffix), path))
+        return sorted(segments)
+
+    def replay(self, after_seq=0):
+        """Yield logged events newer than the snapshot sequence number"""
+        self.count = 0
+        paths = [path for seq, path in self.sealed_segments() if seq > after_seq]
+        paths.append(self.path)
+        for path in paths:
+            if not os.path.exists(path):
+                continue
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        event = json.loads(line)
+                    except ValueError:
+                        # A torn write from a crash can only be the last line
+                        print(f"Skipping corrupt event log line in {path}")
+                        continue
+                    self.count += 1
+                    if event.get("seq", 0) > after_seq:
+                        yield event
+
+    def append(self, event):
+        """Append one event and flush it to the OS"""
+        self.extend([event])
+
+    def extend(self, events):
+        """Append several events with a single flush"""
+        if self._file is None:
+            self._file = open(self.path, 'a', encoding='utf-8')
+        self._file.write("".join(json.dumps(event, separators=(",", ":")) + "\n" for event in events))
+        self._file.flush()
+        self.count += len(events)
+
+    def seal(self, seq):
+        """Close the current log as a segment ending at seq and start a new one"""
+        self.close()
+        if os.path.exists(self.path) and os.path.getsize(self.path) > 0:
+            os.replace(self.path, f"{self.path}.{seq}")
+        self.count = 0
+
+    def discard(self, upto_seq):
+        """Remove sealed segments that are fully contained in a snapshot"""
+        for seq, path in self.sealed_segments():
+            if seq <= upto_seq:
+                os.remove(path)
+
+    def close(self):
+        """Close the log file"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class SnapshotWriter(threading.Thread):
+    """Background thread that coalesces save requests into snapshot writes"""
+
+    def __init__(self, capture, write, delay=1.0, max_delay=10.0):
+        super().__init__(name="FocusFlickWriter", daemon=True)
+        self.capture = capture  # Returns (text, seq) for a consistent snapshot
+        self.write = write  # Persists (text, seq)
+        self.delay = delay
+        self.max_delay = max_delay
+        self._dirty = threading.Event()
+        self._closing = threading.Event()
+        self._save_lock = threading.Lock()
+
+    def mark_dirty(self):
+        """Request a snapshot, bursts of requests are written once"""
+        self._dirty.set()
+
+    def run(self):
+        while not self._closing.is_set():
+            self._dirty.wait()
+            if self._closing.is_set():
+                break
+            
+            # Wait for the burst to settle, but never longer than max_delay
+            started = time.monotonic()
+            while True:
+                self._dirty.clear()
+                if self._closing.wait(self.delay):
+                    break
+                if not self._dirty.is_set() or time.monotonic() - started >= self.max_delay:
+                    break
+            
+            if not self._closing.is_set():
+                self.flush()
+
+    def flush(self):
+        """Capture and write a snapshot on the calling thread"""
+        with self._save_lock:
+            self._dirty.clear()
+            try:
+                text, seq = self.capture()
+                self.write(text, seq)
+            except Exception as e:
+                print(f"Error saving data: {e}")
+
+    def close(self):
+        """Stop the thread and write a final snapshot"""
+        self._closing.set()
+        self._dirty.set()
+        if self.is_alive():
+            self.join(timeout=5)
+        self.flush()
+
+
+class SessionLog:
+    """Append-only CSV file of session records"""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = None
+
+    def load(self, store):
+        """Read every stored session into a SessionStore"""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'r', newline='', encoding='utf-8') as f:
+            for row in csv.reader(f):
+                try:
+                    start, end, mode, task, duration = row
+                    store.add(float(start), float(end), mode, task or None, int(duration))
+                except ValueError:
+                    print(f"Skipping corrupt session record in {self.path}")
+
+    def append(self, start, end, mode, task, duration):
+        """Append one session record"""
+        self.extend([(start, end, mode, task, duration)])
+
+    def extend(self, rows):
+        """Append several session records with a single flush"""
+        if self._file is None:
+            self._file = open(self.path, 'a', newline='', encoding='utf-8')
+            self._writer = csv.writer(self._file)
+        for start, end, mode, task, duration in rows:
+            self._writer.writerow([f"{start:.3f}", f"{end:.3f}", mode, task or "", duration])
+        self._file.flush()
+
+    def rewrite(self, store):
+        """Replace the file with every session in a SessionStore"""
+        self.close()
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            for start, end, mode, task, duration in store.sessions():
+                writer.writerow([f"{start:.3f}", f"{end:.3f}", mode, task or "", duration])
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    def close(self):
+        """Close the session file"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+# ===== Task Archive =====
+# Completed tasks past the archive age leave the data tree for one gzip
+# JSON segment per month of completion, read only when a view asks for
+# that month. Both backends share the same archive directory.
+
+ARCHIVE_SUFFIX = ".json.gz"
+
+
+class TaskArchive:
+    """Month-partitioned, compressed segments of archived tasks"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        # month -> tasks and month -> {id: task}, for the segments read so far
+        self._segments = {}
+        self._by_id = {}
+
+    def _path(self, month):
+        return os.path.join(self.directory, month + ARCHIVE_SUFFIX)
+
+    def months(self):
+        """Months with a segment, oldest first"""
+        if not os.path.isdir(self.directory):
+            return []
+        return sorted(name[:-len(ARCHIVE_SUFFIX)] for name in os.listdir(self.directory) if name.endswith(ARCHIVE_SUFFIX))
+
+    def load(self, month):
+        """Tasks of one month, read from disk on first use"""
+        if month not in self._segments:
+            try:
+                with gzip.open(self._path(month), 'rt', encoding='utf-8') as f:
+                    tasks = json.load(f)
+            except FileNotFoundError:
+                tasks = []
+            self._segments[month] = tasks
+            self._by_id[month] = {task["id"]: task for task in tasks}
+        return self._segments[month]
+
+    def get(self, month, task_id):
+        """Archived task by the month it was filed under and its id, or None"""
+        self.load(month)
+        return self._by_id[month].get(task_id)
+
+    def add(self, month, tasks):
+        """Write tasks into a month's segment, replacing any with the same id"""
+        ids = {task["id"] for task in tasks}
+        merged = [task for task in self.load(month) if task["id"] not in ids] + list(tasks)
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = self._path(month) + ".tmp"
+        with open(tmp_path, 'wb') as raw:
+            with gzip.GzipFile(fileobj=raw, mode='wb') as f:
+                f.write(json.dumps(merged, separators=(",", ":")).encode('utf-8'))
+            raw.flush()
+            os.fsync(raw.fileno())
+        os.replace(tmp_path, self._path(month))
+        _fsync_dir(self.directory)
+        self._segments[month] = merged
+        self._by_id[month] = {task["id"]: task for task in merged}
+
+    def tasks_between(self, start_date=None, end_date=None):
+        """Archived tasks completed within the date range, reading only the months it spans"""
+        first = start_date.isoformat() if start_date else ""
+        last = end_date.isoformat() if end_date else "9999-12-31"
+        tasks = []
+        for month in self.months():
+            if first[:7] <= month <= last[:7]:
+                tasks.extend(task for task in self.load(month) if first <= task["completed_date"][:10] <= last)
+        return tasks
+
+    def clear(self):
+        """Delete every segment"""
+        for month in self.months():
+            os.remove(self._path(month))
+        self._segments.clear()
+        self._by_id.clear()
+
+
+# ===== Storage Backends =====
+# Both backends expose the same interface to FocusFlickPro: load() and
+# replay() at startup, append() for every mutation, capture()/write() for
+# full snapshots from the writer thread and replace_all() for imports.
+# append_many() and append_sessions() persist batches with a single flush.
+
+class JsonStorage:
+    """JSON snapshot with an event log and a session CSV next to it"""
+    
+    kind = "json"
+
+    def __init__(self, data_file, log_file, sessions_file, generations=3, compact_threshold=200):
+        self.snapshots = SnapshotStore(data_file, generations)
+        self.event_log = EventLog(log_file)
+        self.session_log = SessionLog(sessions_file)
+        self.compact_threshold = compact_threshold
+
+    def load(self):
+        """Load the newest valid snapshot"""
+        return self.snapshots.load()
+
+    def replay(self, data):
+        """Apply logged events newer than the snapshot, returns how many"""
+        replayed = 0
+        for event in self.event_log.replay(data.get("log_seq", 0)):
+            apply_event(data, event)
+            data["log_seq"] = event["seq"]
+            replayed += 1
+        return replayed
+
+    def load_sessions(self, store):
+        self.session_log.load(store)
+
+    def append(self, event, data, find=None):
+        self.event_log.append(event)
+
+    def append_many(self, events, data, find=None):
+        self.event_log.extend(events)
+
+    def append_session(self, start, end, mode, task, duration):
+        self.session_log.append(start, end, mode, task, duration)
+
+    def append_sessions(self, rows):
+        self.session_log.extend(rows)
+
+    def needs_compaction(self):
+        return self.event_log.count >= self.compact_threshold
+
+    def capture(self, data):
+        """Serialize the data and seal the event log at the same point"""
+        text = json.dumps(data, indent=2)
+        seq = data.get("log_seq", 0)
+        self.event_log.seal(seq)
+        return text, seq
+
+    def write(self, text, seq):
+        """Write a snapshot and drop the log segments every kept generation contains
+        
+        A backup generation loaded after the newest is lost still finds
+        the events logged since it in the segments.
+        """
+        if self.snapshots.write(text, seq):
+            self.event_log.discard(self.snapshots.oldest_seq())
+
+    def save_all(self, data):
+        """Write the whole data tree now"""
+        self.write(*self.capture(data))
+
+    def replace_all(self, data, sessions):
+        """Overwrite everything with the given data and session history"""
+        self.save_all(data)
+        self.session_log.rewrite(sessions)
+
+    def close(self):
+        self.event_log.close()
+        self.session_log.close()
+
+
+# User fields each event changes, so SQLite only rewrites those meta rows
+EVENT_USER_KEYS = {
+    "session_completed": ("sessions", "total_seconds", "xp"),
+    "time_credited": ("total_seconds",),
+    "sessions_imported": ("sessions", "total_seconds"),
+    "xp_awarded": ("xp",),
+    "level_changed": ("level", "xp"),
+    "streak_updated": ("streak", "last_session"),
+    "achievement_unlocked": ("achievements",),
+    "sync_baseline": ("xp",),
+}
+
+# Top-level dicts kept as one meta row per entry, they grow with the data
+SECTIONED_META = ("sync_stamps", "archived")
+
+TASK_COLUMNS = ("name", "priority", "completed", "created", "completed_date", "due_date", "description")
+HABIT_COLUMNS = ("name", "description", "created", "active")
+
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS tasks (
+    id TEXT PRIMARY KEY,
+    position INTEGER,
+    name TEXT,
+    priority INTEGER,
+    completed INTEGER,
+    created TEXT,
+    completed_date TEXT,
+    due_date TEXT,
+    description TEXT,
+    extra TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_priority ON tasks (priority);
+CREATE INDEX IF NOT EXISTS idx_tasks_completed ON tasks (completed);
+CREATE INDEX IF NOT EXISTS idx_tasks_completed_date ON tasks (completed_date);
+CREATE INDEX IF NOT EXISTS idx_tasks_due_date ON tasks (due_date);
+CREATE TABLE IF NOT EXISTS task_notes (
+    task_id TEXT,
+    date TEXT,
+    content TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_task_notes_task ON task_notes (task_id);
+CREATE TABLE IF NOT EXISTS habits (
+    id TEXT PRIMARY KEY,
+    position INTEGER,
+    name TEXT,
+    description TEXT,
+    created TEXT,
+    active INTEGER,
+    extra TEXT
+);
+CREATE TABLE IF NOT EXISTS habit_completions (
+    habit_id TEXT,
+    day TEXT,
+    PRIMARY KEY (habit_id, day)
+);
+CREATE INDEX IF NOT EXISTS idx_habit_completions_day ON habit_completions (day);
+CREATE TABLE IF NOT EXISTS sessions (
+    start REAL,
+    end REAL,
+    mode TEXT,
+    task TEXT,
+    duration INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_start ON sessions (start);
+CREATE TABLE IF NOT EXISTS daily_rollup (
+    day TEXT PRIMARY KEY,
+    focus_seconds INTEGER,
+    sessions INTEGER,
+    tasks_completed INTEGER,
+    habit_completions INTEGER,
+    xp INTEGER
+);
+"""
+
+
+class SqliteStorage:
+    """SQLite database where every mutation is a single-row write
+    
+    The tables are current after every append, so snapshots only write
+    anything when an append failed. The whole tree is then rewritten,
+    by the next append or the next snapshot, whichever comes first.
+    """
+    
+    kind = "sqlite"
+
+    def __init__(self, path):
+        self.path = path
+        # The writer thread and the Tk thread share the connection
+        self._lock = threading.RLock()
+        # log_seq the tables hold, and the newest one a failed append left out
+        self.synced_seq = 0
+        self.pending_seq = 0
+        # Imported here so JSON users don't pay for it at startup
+        import sqlite3
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SQLITE_SCHEMA)
+        self.conn.commit()
+
+    def load(self):
+        """Rebuild the data tree from the tables, None for an empty database"""
+        with self._lock:
+            meta = {key: json.loads(value) for key, value in self.conn.execute("SELECT key, value FROM meta")}
+            if not meta:
+                return None
+            
+            # Sectioned dicts with no entries have no rows
+            data = {"user": {}, "settings": {}, **{section: {} for section in SECTIONED_META}}
+            for key, value in meta.items():
+                section, _, name = key.partition(".")
+                if name:
+                    data.setdefault(section, {})[name] = value
+                else:
+                    data[key] = value
+            self.synced_seq = data.get("log_seq", 0)
+            
+            notes = {}
+            for task_id, date, content in self.conn.execute("SELECT task_id, date, content FROM task_notes ORDER BY rowid"):
+                notes.setdefault(task_id, []).append({"date": date, "content": content})
+            
+            data["user"]["tasks"] = []
+            for row in self.conn.execute(f"SELECT id, extra, {', '.join(TASK_COLUMNS)} FROM tasks ORDER BY position"):
+                task = self._row_to_item(row, TASK_COLUMNS)
+                task["completed"] = bool(task.get("completed"))
+                if row[0] in notes:
+                    task["notes"] = notes[row[0]]
+                data["user"]["tasks"].append(task)
+            
+            completions = {}
+            for habit_id, day in self.conn.execute("SELECT habit_id, day FROM habit_completions ORDER BY day"):
+                completions.setdefault(habit_id, []).append(day)
+            
+            data["user"]["habits"] = []
+            for row in self.conn.execute(f"SELECT id, extra, {', '.join(HABIT_COLUMNS)} FROM habits ORDER BY position"):
+                habit = self._row_to_item(row, HABIT_COLUMNS)
+                habit["active"] = bool(habit.get("active"))
+                if row[0] in completions:
+                    habit["completions"] = completions[row[0]]
+                data["user"]["habits"].append(habit)
+            
+            rollup = {row[0]: list(row[1:]) for row in self.conn.execute("SELECT * FROM daily_rollup")}
+            if rollup:
+                data["rollup"] = rollup
+            return data
+
+    def _row_to_item(self, row, columns):
+        item = {"id": row[0]}
+        item.update(json.loads(row[1]) if row[1] else {})
+        for column, value in zip(columns, row[2:]):
+            if value is not None:
+                item[column] = value
+        return item
+
+    def replay(self, data):
+        # Mutations are applied to the tables directly, nothing to replay
+        return 0
+
+    def load_sessions(self, store):
+        with self._lock:
+            for row in self.conn.execute("SELECT start, end, mode, task, duration FROM sessions ORDER BY start"):
+                store.add(*row)
+
+    def append(self, event, data, find=None):
+        """Persist one mutation as single-row upserts"""
+        self.append_many([event], data, find)
+
+    def append_many(self, events, data, find=None):
+        """Persist mutations already applied to data in one transaction
+        
+        find(section, item_id) returns a task or habit, by default by
+        scanning the list. FocusCore.find looks them up by id.
+        """
+        if find is None:
+            def find(section, item_id):
+                return find_by_id(data["user"][section], item_id)
+        with self._lock:
+            try:
+                if self.pending_seq:
+                    # An earlier append was lost, data has it and everything since
+                    self._write_data(json.loads(json.dumps(data)))
+                else:
+                    for event in events:
+                        self._apply(event, data, find)
+                        if "stamp" in event:
+                            for register in event_registers(event):
+                                self._set_meta("sync_stamps." + register, data["sync_stamps"][register])
+                        day = rollup_day(event, data)
+                        if day in data.get("rollup", {}):
+                            self._upsert_rollup(day, data["rollup"][day])
+                    self._set_meta("log_seq", data.get("log_seq", 0))
+                self.conn.commit()
+            except Exception:
+                self.conn.rollback()
+                self.pending_seq = max(self.pending_seq, data.get("log_seq", 0))
+                raise
+            self.synced_seq = data.get("log_seq", 0)
+            self.pending_seq = 0
+
+    def _apply(self, event, data, find):
+        kind = event["type"]
+        user = data["user"]
+        if kind.startswith("sync_"):
+            self._set_meta("sync", data["sync"])
+        if kind in EVENT_USER_KEYS:
+            for key in EVENT_USER_KEYS[kind]:
+                self._set_meta("user." + key, user[key])
+        elif kind == "user_changed":
+            self._set_meta("user." + event["key"], event["value"])
+        elif kind == "setting_changed":
+            self._set_meta("settings." + event["key"], event["value"])
+        elif kind in ("task_added", "task_updated", "task_toggled"):
+            task = find("tasks", event["task"]["id"] if kind == "task_added" else event["id"])
+            if task is not None:
+                self._upsert_task(task)
+        elif kind == "task_note_added":
+            self.conn.execute(
+                "INSERT INTO task_notes (task_id, date, content) VALUES (?, ?, ?)",
+                (event["id"], event["note"]["date"], event["note"]["content"])
+            )
+        elif kind == "task_deleted":
+            self.conn.execute("DELETE FROM tasks WHERE id = ?", (event["id"],))
+            self.conn.execute("DELETE FROM task_notes WHERE task_id = ?", (event["id"],))
+        elif kind == "tasks_archived":
+            for month, ids in event["months"].items():
+                self.conn.executemany("DELETE FROM tasks WHERE id = ?", [(task_id,) for task_id in ids])
+                self.conn.executemany("DELETE FROM task_notes WHERE task_id = ?", [(task_id,) for task_id in ids])
+                for task_id in ids:
+                    self._set_meta("archived." + task_id, month)
+        elif kind in ("habit_added", "habit_updated"):
+            habit = find("habits", event["habit"]["id"] if kind == "habit_added" else event["id"])
+            if habit is not None:
+                self._upsert_habit(habit)
+        elif kind == "habit_completion_added":
+            self.conn.execute(
+                "INSERT OR IGNORE INTO habit_completions (habit_id, day) VALUES (?, ?)",
+                (event["id"], event["date"])
+            )
+        elif kind == "habit_completion_removed":
+            self.conn.execute(
+                "DELETE FROM habit_completions WHERE habit_id = ? AND day = ?",
+                (event["id"], event["date"])
+            )
+        elif kind == "habit_deleted":
+            self.conn.execute("DELETE FROM habits WHERE id = ?", (event["id"],))
+            self.conn.execute("DELETE FROM habit_completions WHERE habit_id = ?", (event["id"],))
+
+    def _set_meta(self, key, value):
+        self.conn.execute(
+            "INSERT INTO meta (key, value) VALUES (?, ?) "
+            "ON CONFLICT (key) DO UPDATE SET value = excluded.value",
+            (key, json.dumps(value))
+        )
+
+    def _upsert_rollup(self, day, counters):
+        self.conn.execute("INSERT OR REPLACE INTO daily_rollup VALUES (?, ?, ?, ?, ?, ?)", (day, *counters))
+
+    def _upsert_task(self, task, position=None):
+        self._upsert_item("tasks", TASK_COLUMNS, task, "notes", position)
+
+    def _upsert_habit(self, habit, position=None):
+        self._upsert_item("habits", HABIT_COLUMNS, habit, "completions", position)
+
+    def _upsert_item(self, table, columns, item, child_key, position):
+        """Insert or update one task or habit row, an update keeps its position
+        
+        Without a position a new row goes after the last one, so rows
+        added after a delete never share a position.
+        """
+        extra = {k: v for k, v in item.items() if k not in columns and k not in ("id", child_key)}
+        position_sql = "?" if position is not None else f"(SELECT COALESCE(MAX(position), -1) + 1 FROM {table})"
+        updates = ", ".join(f"{column} = excluded.{column}" for column in ("extra",) + columns)
+        self.conn.execute(
+            f"INSERT INTO {table} (id, position, extra, {', '.join(columns)}) "
+            f"VALUES (?, {position_sql}, ?, {', '.join('?' * len(columns))}) "
+            f"ON CONFLICT (id) DO UPDATE SET {updates}",
+            (item["id"],) + ((position,) if position is not None else ())
+            + (json.dumps(extra) if extra else None,) + tuple(item.get(c) for c in columns)
+        )
+
+    def append_session(self, start, end, mode, task, duration):
+        self.append_sessions([(start, end, mode, task, duration)])
+
+    def append_sessions(self, rows):
+        """Insert session records in one transaction"""
+        with self._lock:
+            self.conn.executemany(
+                "INSERT INTO sessions (start, end, mode, task, duration) VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+            self.conn.commit()
+
+    def needs_compaction(self):
+        return False
+
+    def capture(self, data):
+        """Serialize the data only if a failed append left the tables behind"""
+        with self._lock:
+            text = json.dumps(data) if self.pending_seq else None
+        return text, data.get("log_seq", 0)
+
+    def write(self, text, seq):
+        """Rewrite the data tables from a snapshot taken after a failed append
+        
+        Skipped when the tables are already current, or when an append
+        has since written newer changes than the snapshot holds.
+        """
+        with self._lock:
+            if text is None or not self.pending_seq or seq < self.synced_seq:
+                return
+            self._save(json.loads(text))
+
+    def save_all(self, data):
+        """Write the whole data tree now"""
+        with self._lock:
+            self._save(json.loads(json.dumps(data)))
+
+    def _save(self, data):
+        try:
+            self._write_data(data)
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        seq = data.get("log_seq", 0)
+        self.synced_seq = seq
+        if seq >= self.pending_seq:
+            self.pending_seq = 0
+
+    def _write_data(self, data):
+        self.conn.execute("DELETE FROM meta")
+        self.conn.execute("DELETE FROM tasks")
+        self.conn.execute("DELETE FROM task_notes")
+        self.conn.execute("DELETE FROM habits")
+        self.conn.execute("DELETE FROM habit_completions")
+        self.conn.execute("DELETE FROM daily_rollup")
+        
+        for key, value in data.items():
+            if key in ("user", "settings", "rollup") or key in SECTIONED_META:
+                continue
+            self._set_meta(key, value)
+        # One row per entry so a write only touches its own
+        for section in SECTIONED_META:
+            for name, value in data.get(section, {}).items():
+                self._set_meta(f"{section}.{name}", value)
+        for day, counters in data.get("rollup", {}).items():
+            self._upsert_rollup(day, counters)
+        for key, value in data["settings"].items():
+            self._set_meta("settings." + key, value)
+        for key, value in data["user"].items():
+            if key not in ("tasks", "habits"):
+                self._set_meta("user." + key, value)
+        
+        for position, task in enumerate(data["user"]["tasks"]):
+            self._upsert_task(task, position)
+            self.conn.executemany(
+                "INSERT INTO task_notes (task_id, date, content) VALUES (?, ?, ?)",
+                [(task["id"], note["date"], note["content"]) for note in task.get("notes", [])]
+            )
+        for position, habit in enumerate(data["user"]["habits"]):
+            self._upsert_habit(habit, position)
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO habit_completions (habit_id, day) VALUES (?, ?)",
+                [(habit["id"], day) for day in habit.get("completions", [])]
+            )
+
+    def replace_all(self, data, sessions):
+        """Overwrite everything with the given data and session history"""
+        with self._lock:
+            try:
+                self._write_data(json.loads(json.dumps(data)))
+                self.conn.execute("DELETE FROM sessions")
+                self.conn.executemany(
+                    "INSERT INTO sessions (start, end, mode, task, duration) VALUES (?, ?, ?, ?, ?)",
+                    list(sessions.sessions())
+                )
+                self.conn.commit()
+            except Exception:
+                self.conn.rollback()
+                raise
+            self.synced_seq = data.get("log_seq", 0)
+            self.pending_seq = 0
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+
+def open_storage(data_file, log_file, sessions_file, db_file, generations=3, compact_threshold=200):
+    """Open the SQLite database if one exists, otherwise the JSON files"""
+    if os.path.exists(db_file):
+        return SqliteStorage(db_file)
+    return JsonStorage(data_file, log_file, sessions_file, generations, compact_threshold)
+
+
+def load_storage(storage):
+    """Read the data and session history of a storage
+    
+    Older snapshots are upgraded once, before the events logged against
+    them are replayed. Returns a dict with "data" (the defaults if no
+    snapshot loaded), "sessions", "loaded", "migrated" and the number of
+    events "replayed". Errors are printed and skip only their step.
+    """
+    try:
+        data = storage.load()
+    except Exception as e:
+        print(f"Error loading data: {e}")
+        data = None
+    loaded = data is not None
+    if not loaded:
+        data = default_data()
+    
+    sessions = SessionStore()
+    try:
+        storage.load_sessions(sessions)
+    except Exception as e:
+        print(f"Error loading sessions: {e}")
+    
+    migrated = migrate_data(data, sessions)
+    
+    # Replay mutations logged since the last snapshot
+    replayed = 0
+    try:
+        replayed = storage.replay(data)
+    except Exception as e:
+        print(f"Error replaying event log: {e}")
+    return {"data": data, "sessions": sessions, "loaded": loaded, "migrated": migrated, "replayed": replayed}
+
+
+def migrate_json_to_sqlite(data_file, log_file, sessions_file, db_file):
+    """One-shot copy of the JSON files into a new SQLite database"""
+    source = JsonStorage(data_file, log_file, sessions_file)
+    data = source.load()
+    if data is None:
+        source.close()
+        raise ValueError(f"No data to migrate in {data_file}")
+    sessions = SessionStore()
+    source.load_sessions(sessions)
+    migrate_data(data, sessions)
+    source.replay(data)
+    source.close()
+    
+    # Build the database under a temporary name so a failure leaves nothing behind
+    tmp_path = db_file + ".tmp"
+    for path in (tmp_path, tmp_path + "-wal", tmp_path + "-shm"):
+        if os.path.exists(path):
+            os.remove(path)
+    db = SqliteStorage(tmp_path)
+    try:
+        db.replace_all(data, sessions)
+        db.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    finally:
+        db.close()
+    os.replace(tmp_path, db_file)
+    # The JSON files are left untouched as a backup
@@ -0,0 +1,208 @@
+import json
+import os
+import time
+
+from focusflick_core import event_registers
+
+LOG_SUFFIX = ".jsonl"
+# Events about this device's sync state or its own archive, never published
+LOCAL_EVENTS = ("sync_changed", "sync_merged", "sync_baseline", "tasks_archived")
+# Recomputed by every device from the merged XP instead
+DERIVED_EVENTS = ("level_changed",)
+# Stamped even while sync is off, so later remote edits find the tombstone
+TOMBSTONE_EVENTS = ("task_deleted", "habit_deleted")
+# What an entry of another device's log should do here
+SKIP = "skip"
+WAIT = "wait"
+
+
+class SyncFolder:
+    """Change logs of every device in a shared folder
+    
+    Each device appends the events it records to <folder>/<device>.jsonl
+    and reads the other devices' logs from the byte offset it merged up
+    to, so a merge costs as much as the changes since the last one. Any
+    folder every device can see works, e.g. one kept in step by a file
+    sync client or an NFS mount.
+    """
+
+    def __init__(self, folder, device):
+        self.folder = folder
+        self.device = device
+        self.path = os.path.join(folder, device + LOG_SUFFIX)
+        self._file = None
+
+    def started(self):
+        """True if this device has published to the folder before"""
+        return os.path.exists(self.path)
+
+    def publish(self, entries):
+        """Append entries to this device's log, skipping those that must stay here"""
+        lines = [
+            json.dumps(entry, separators=(",", ":")) + "\n"
+            for entry in entries
+            if entry["type"] not in LOCAL_EVENTS and "origin" not in entry
+        ]
+        if not lines:
+            return
+        if self._file is None:
+            self._file = open(self.path, 'a', encoding='utf-8')
+        self._file.write("".join(lines))
+        self._file.flush()
+
+    def pull(self, offsets):
+        """(device, [(offset after, entry)]) for every other log with new complete lines"""
+        changes = []
+        for name in sorted(os.listdir(self.folder)):
+            device = name[:-len(LOG_SUFFIX)]
+            if not name.endswith(LOG_SUFFIX) or device == self.device:
+                continue
+            offset = offsets.get(device, 0)
+            path = os.path.join(self.folder, name)
+            if os.path.getsize(path) <= offset:
+                continue
+            with open(path, 'rb') as f:
+                f.seek(offset)
+                chunk = f.read()
+            
+            # A line still being written or synced is read next time
+            entries = []
+            for line in chunk[:chunk.rfind(b"\n") + 1].splitlines(keepends=True):
+                offset += len(line)
+                try:
+                    entries.append((offset, json.loads(line)))
+                except ValueError:
+                    print(f"Skipping corrupt sync log line in {path}")
+            if entries:
+                changes.append((device, entries))
+        return changes
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def session_entry(start, end, mode, task, seconds):
+    """Log entry sharing a session record, stored to the millisecond like the history"""
+    return {"type": "session_recorded", "row": [round(start, 3), round(end, 3), mode, task, seconds]}
+
+
+def baseline_entry(total):
+    """Log entry with the total XP a device had when it joined"""
+    return {"type": "xp_baseline", "total": total}
+
+
+def stamp_event(event, device, syncing):
+    """Add the [time, device] stamp a local change is merged by
+    
+    Only changes made while syncing are stamped, except deletions: an
+    item deleted while sync was off must still win over remote edits,
+    which would otherwise wait for the item forever.
+    """
+    if "stamp" not in event and (syncing or event["type"] in TOMBSTONE_EVENTS):
+        event["stamp"] = [time.time(), device or ""]
+
+
+def plan_entry(core, device, entry):
+    """How to merge an entry of device's log into core's data
+    
+    Returns an event (type, payload) to apply, ("session_recorded", row)
+    for a session record, SKIP when the data already has it or holds a
+    newer write, or WAIT when it refers to a task or habit whose
+    creation hasn't arrived yet. Habit completions, task fields and
+    settings are last-writer-wins registers, notes, achievements and
+    sessions grow-only sets, XP and focus time counters.
+    """
+    kind = entry["type"]
+    payload = {key: value for key, value in entry.items() if key not in ("type", "seq")}
+    data = core.data
+    stamps = data["sync_stamps"]
+    stamp = entry.get("stamp", [0, ""])
+
+    def newer(register):
+        return register not in stamps or stamp > stamps[register]
+    
+    if kind == "xp_baseline":
+        return "sync_baseline", {"log": device, "total": entry["total"]}
+    if kind == "session_recorded":
+        row = tuple(entry["row"])
+        return SKIP if core.sessions.has(row[0], row[2]) else (kind, row)
+    if kind in LOCAL_EVENTS or kind in DERIVED_EVENTS:
+        return SKIP
+    if kind == "sessions_imported":
+        payload["sessions"] = [row for row in entry["sessions"] if not core.sessions.has(row[0], row[2])]
+        return (kind, payload) if payload["sessions"] else SKIP
+    if kind == "achievement_unlocked":
+        unlocked = {a.get("id") for a in data["user"]["achievements"] if isinstance(a, dict)}
+        return SKIP if entry["achievement"]["id"] in unlocked else (kind, payload)
+    
+    if kind.startswith("task_"):
+        # Tasks archived here were completed long ago, later edits stay out
+        task_id = entry["task"]["id"] if kind == "task_added" else entry["id"]
+        if task_id in data["archived"]:
+            return SKIP
+    
+    if kind in ("task_added", "habit_added"):
+        prefix = kind.split("_")[0]
+        store = core.tasks if prefix == "task" else core.habits
+        item_id = entry[prefix]["id"]
+        if store.get(item_id) is not None or f"{prefix}:{item_id}:deleted" in stamps:
+            return SKIP
+        return kind, payload
+    
+    if kind.startswith(("task_", "habit_")):
+        prefix = kind.split("_")[0]
+        store = core.tasks if prefix == "task" else core.habits
+        if f"{prefix}:{entry['id']}:deleted" in stamps:
+            return SKIP
+        item = store.get(entry["id"])
+        if item is None:
+            return WAIT
+        if kind in ("task_updated", "habit_updated"):
+            # Field by field, each is its own register
+            payload["fields"] = {k: v for k, v in entry.get("fields", {}).items() if newer(f"{prefix}:{entry['id']}:{k}")}
+            payload["removed"] = [k for k in entry.get("removed", []) if newer(f"{prefix}:{entry['id']}:{k}")]
+            return (kind, payload) if payload["fields"] or payload["removed"] else SKIP
+        if kind == "task_note_added":
+            notes = {(note.get("date"), note.get("content")) for note in item.get("notes", [])}
+            note = entry["note"]
+            return SKIP if (note.get("date"), note.get("content")) in notes else (kind, payload)
+    
+    registers = event_registers(entry)
+    if registers and not any(newer(register) for register in registers):
+        return SKIP
+    return kind, payload
+
+
+def merge_changes(core, changes, apply):
+    """Merge what SyncFolder.pull() returned into core
+    
+    apply(type, payload) records each merged event, including the
+    sync_merged offsets, so none is merged twice. A device's log stops
+    at its first entry that has to WAIT. Returns the number of entries
+    merged and the session rows added to core.sessions.
+    """
+    merged = 0
+    rows = []
+    for device, entries in changes:
+        offset = None
+        for end, entry in entries:
+            plan = plan_entry(core, device, entry)
+            if plan == WAIT:
+                break
+            offset = end
+            if plan == SKIP:
+                continue
+            kind, value = plan
+            merged += 1
+            if kind == "session_recorded":
+                core.sessions.add(*value)
+                rows.append(value)
+                continue
+            apply(kind, {**value, "origin": device})
+            if kind == "sessions_imported":
+                rows.extend(tuple(row) for row in value["sessions"])
+        if offset is not None:
+            apply("sync_merged", {"log": device, "offset": offset})
+    return merged, rows
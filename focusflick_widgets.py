@@ -0,0 +1,225 @@
+import time
+
+import customtkinter as ctk
+
+
+class VirtualList(ctk.CTkFrame):
+    """Scrollable list that only builds widgets for the rows on screen"""
+    
+    WHEEL_ROWS = 3
+
+    def __init__(self, master, row_height, create_row, bind_row, **kwargs):
+        super().__init__(master, **kwargs)
+        self.row_height = row_height
+        self.create_row = create_row
+        self.bind_row = bind_row
+        self.items = []
+        self.first = 0
+        # Row widgets in screen order, rows[i] shows items[first + i]
+        self.rows = []
+        
+        self.viewport = ctk.CTkFrame(self, fg_color="transparent")
+        self.viewport.pack(side="left", fill="both", expand=True)
+        self.scrollbar = ctk.CTkScrollbar(self, command=self.yview)
+        self.scrollbar.pack(side="right", fill="y")
+        
+        self.viewport.bind("<Configure>", lambda e: self.render())
+        self.bind_all("<MouseWheel>", self.on_wheel, add="+")
+        self.bind_all("<Button-4>", self.on_wheel, add="+")
+        self.bind_all("<Button-5>", self.on_wheel, add="+")
+
+    def visible_count(self):
+        """Number of rows that fit in the viewport, plus a partial one"""
+        return max(1, self.viewport.winfo_height() // self.row_height + 1)
+
+    def set_items(self, items):
+        """Show a new list of items, keeping the scroll position if possible"""
+        self.items = items
+        self.first = max(0, min(self.first, len(items) - self.visible_count() + 1))
+        self.render()
+
+    def render(self):
+        """Bind the visible items to the pooled row widgets"""
+        count = min(self.visible_count(), len(self.items))
+        while len(self.rows) < count:
+            self.rows.append(self.create_row(self.viewport))
+        
+        for i, row in enumerate(self.rows):
+            index = self.first + i
+            if index < len(self.items):
+                self.bind_row(row, self.items[index])
+                row.place(x=0, y=i * self.row_height, relwidth=1)
+            else:
+                row.place_forget()
+        
+        total = len(self.items)
+        if total:
+            self.scrollbar.set(self.first / total, min(1.0, (self.first + count) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def refresh_item(self, item):
+        """Re-bind only the row showing item, returns False if it is off screen"""
+        for i, row in enumerate(self.rows):
+            index = self.first + i
+            if index < len(self.items) and self.items[index] is item:
+                self.bind_row(row, item)
+                return True
+        return False
+
+    def scroll_to(self, first):
+        """Make items[first] the top row"""
+        last = max(0, len(self.items) - self.visible_count() + 1)
+        first = max(0, min(first, last))
+        if first != self.first:
+            self.first = first
+            self.render()
+
+    def yview(self, *args):
+        """Scrollbar callback"""
+        if args[0] == "moveto":
+            self.scroll_to(int(float(args[1]) * len(self.items)))
+        elif args[0] == "scroll":
+            amount = int(args[1])
+            if args[2] == "pages":
+                amount *= max(1, self.visible_count() - 1)
+            self.scroll_to(self.first + amount)
+
+    def on_wheel(self, event):
+        """Scroll when the mouse wheel turns over the list"""
+        if not str(event.widget).startswith(str(self.viewport)):
+            return
+        if event.num == 4 or getattr(event, "delta", 0) > 0:
+            self.scroll_to(self.first - self.WHEEL_ROWS)
+        else:
+            self.scroll_to(self.first + self.WHEEL_ROWS)
+
+
+class KeyedRows:
+    """Packed rows keyed by entity, patched only when their view state changes"""
+
+    def __init__(self, parent, create_row, update_row):
+        self.parent = parent
+        self.create_row = create_row
+        self.update_row = update_row
+        # key -> (widget, state) of the rows currently shown
+        self.rows = {}
+        self.order = []
+
+    def render(self, entries):
+        """Show (key, state) entries in order, touching only what changed"""
+        keys = [key for key, state in entries]
+        for key in set(self.rows) - set(keys):
+            self.rows.pop(key)[0].destroy()
+        
+        for key, state in entries:
+            if key not in self.rows:
+                widget = self.create_row(self.parent, state)
+                self.rows[key] = (widget, state)
+                self.order = None
+            elif self.rows[key][1] != state:
+                self.update_row(self.rows[key][0], state)
+                self.rows[key] = (self.rows[key][0], state)
+        
+        # Re-pack only when rows were added or moved
+        if keys != self.order:
+            for key in keys:
+                self.rows[key][0].pack_forget()
+            for key in keys:
+                widget = self.rows[key][0]
+                widget.pack(**getattr(widget, "pack_kwargs", {"fill": "x"}))
+            self.order = keys
+
+
+def set_text(widget, text):
+    """Configure a widget's text only if it differs from what is shown"""
+    if widget.cget("text") != text:
+        widget.configure(text=text)
+
+
+class AnimationScheduler:
+    """Runs named effects on a widget's after() queue, one per name"""
+
+    def __init__(self, widget):
+        self.widget = widget
+        # name -> after id of the effect's next step
+        self.pending = {}
+
+    def start(self, name, effect):
+        """Run a generator that yields the delay in ms before its next step
+        
+        Starting an effect under a name that is still running cancels the
+        old one first.
+        """
+        self.cancel(name)
+        self._step(name, effect)
+
+    def _step(self, name, effect):
+        self.pending.pop(name, None)
+        try:
+            delay = next(effect)
+        except StopIteration:
+            return
+        self.pending[name] = self.widget.after(delay, lambda: self._step(name, effect))
+
+    def cancel(self, name):
+        """Stop an effect if it is running"""
+        after_id = self.pending.pop(name, None)
+        if after_id is not None:
+            self.widget.after_cancel(after_id)
+
+    def cancel_all(self):
+        """Stop every running effect"""
+        for name in list(self.pending):
+            self.cancel(name)
+
+    def active_count(self):
+        """Number of scheduled callbacks, for diagnostics"""
+        return len(self.pending)
+
+
+class TickScheduler:
+    """Single once-a-second after() chain shared by every ticking display
+    
+    Ticks land just after wall-clock second boundaries so displays that
+    show seconds change together, and there is never more than one
+    pending tick however often subscribers are added again.
+    """
+
+    def __init__(self, widget, clock=time.time):
+        self.widget = widget
+        self.clock = clock
+        # name -> callback run on every tick
+        self.subscribers = {}
+        self.after_id = None
+
+    def subscribe(self, name, callback):
+        """Run callback now and then once per second, replacing any under name"""
+        self.subscribers[name] = callback
+        callback()
+        self._schedule()
+
+    def unsubscribe(self, name):
+        """Stop calling a subscriber, the chain stops when none are left"""
+        self.subscribers.pop(name, None)
+        if not self.subscribers and self.after_id is not None:
+            self.widget.after_cancel(self.after_id)
+            self.after_id = None
+
+    def _schedule(self):
+        if self.after_id is None and self.subscribers:
+            # Milliseconds to the next whole second, never zero
+            delay = int((1 - self.clock() % 1) * 1000) + 1
+            self.after_id = self.widget.after(delay, self._tick)
+
+    def _tick(self):
+        self.after_id = None
+        for name, callback in list(self.subscribers.items()):
+            # A callback may have unsubscribed this one
+            if self.subscribers.get(name) is callback:
+                # One failing display must not stop the chain for the others
+                try:
+                    callback()
+                except Exception as e:
+                    print(f"Error updating {name}: {e}")
+        self._schedule()
@@ -0,0 +1,106 @@
+import os
+import sys
+import tempfile
+import unittest
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from focusflick_core import FocusCore, default_data
+from focusflick_storage import TaskArchive
+
+TODAY = date(2026, 10, 17)
+
+
+def task(task_id, completed_date, completed=True):
+    return {"id": task_id, "name": f"Task {task_id}", "priority": 1, "completed": completed,
+            "created": "2026-01-01T08:00:00", "completed_date": completed_date}
+
+
+class ArchiveTestCase(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.directory = os.path.join(tmp.name, "archive")
+
+
+class TaskArchiveTest(ArchiveTestCase):
+    def test_round_trip(self):
+        archive = TaskArchive(self.directory)
+        self.assertEqual(archive.months(), [])
+        archive.add("2026-02", [task("a", "2026-02-03T10:00:00"), task("b", "2026-02-20T10:00:00")])
+        archive.add("2026-01", [task("c", "2026-01-31T23:00:00")])
+        # Adding again replaces tasks with the same id
+        archive.add("2026-02", [{**task("a", "2026-02-03T10:00:00"), "name": "Renamed"}])
+        
+        fresh = TaskArchive(self.directory)
+        self.assertEqual(fresh.months(), ["2026-01", "2026-02"])
+        self.assertEqual(sorted(t["id"] for t in fresh.load("2026-02")), ["a", "b"])
+        self.assertEqual(fresh.get("2026-02", "a")["name"], "Renamed")
+        self.assertIsNone(fresh.get("2026-02", "c"))
+        self.assertEqual(fresh.load("2026-03"), [])
+        
+        fresh.clear()
+        self.assertEqual(fresh.months(), [])
+        self.assertEqual(TaskArchive(self.directory).load("2026-02"), [])
+
+    def test_tasks_between_reads_only_months_in_range(self):
+        archive = TaskArchive(self.directory)
+        for month in ("2026-01", "2026-02", "2026-03"):
+            archive.add(month, [task(f"{month}-early", f"{month}-02T10:00:00"), task(f"{month}-late", f"{month}-28T10:00:00")])
+        
+        fresh = TaskArchive(self.directory)
+        tasks = fresh.tasks_between(date(2026, 2, 10), date(2026, 3, 5))
+        self.assertEqual([t["id"] for t in tasks], ["2026-02-late", "2026-03-early"])
+        self.assertEqual(sorted(fresh._segments), ["2026-02", "2026-03"])
+        self.assertEqual(len(fresh.tasks_between()), 6)
+        self.assertEqual(sorted(fresh._segments), ["2026-01", "2026-02", "2026-03"])
+
+
+class ArchiveTasksTest(ArchiveTestCase):
+    def core(self, tasks):
+        data = default_data()
+        data["user"]["tasks"] = tasks
+        return FocusCore(data, archive=TaskArchive(self.directory))
+
+    def test_segments_are_written_before_the_event(self):
+        core = self.core([
+            task("old", "2026-05-01T10:00:00"),
+            task("older", "2026-04-01T10:00:00"),
+            task("recent", "2026-10-01T10:00:00"),
+            task("open", None, completed=False)
+        ])
+        emitted = []
+        
+        def emit(event_type, payload):
+            # The copies are on disk by the time the event is recorded
+            self.assertEqual(TaskArchive(self.directory).months(), ["2026-04", "2026-05"])
+            emitted.append(event_type)
+            core.apply_payload(event_type, payload)
+        
+        self.assertEqual(core.archive_tasks(TODAY, emit), 2)
+        self.assertEqual(emitted, ["tasks_archived"])
+        self.assertEqual([t["id"] for t in core.tasks.all()], ["recent", "open"])
+        self.assertEqual(core.data["archived"], {"old": "2026-05", "older": "2026-04"})
+        self.assertEqual(core.archived_task("old")["completed_date"], "2026-05-01T10:00:00")
+        self.assertEqual(sorted(t["id"] for t in core.completed_between()), ["old", "older", "recent"])
+        self.assertEqual(core.archive_tasks(TODAY, emit), 0)
+
+    def test_segment_from_a_crash_before_the_event_is_ignored(self):
+        core = self.core([task("old", "2026-05-01T10:00:00")])
+        # Crash after the segment was written, tasks_archived never recorded
+        core.archive_tasks(TODAY, lambda event_type, payload: None)
+        self.assertEqual(TaskArchive(self.directory).months(), ["2026-05"])
+        
+        core = self.core([task("old", "2026-05-01T10:00:00")])
+        self.assertEqual(core.archived_tasks(), [])
+        self.assertIsNone(core.archived_task("old"))
+        self.assertEqual([t["id"] for t in core.completed_between()], ["old"])
+        # The next run archives the task again without duplicating it
+        core.archive_tasks(TODAY, core.apply_payload)
+        self.assertEqual([t["id"] for t in core.completed_between()], ["old"])
+        self.assertEqual(len(TaskArchive(self.directory).load("2026-05")), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+import os
+import sys
+import unittest
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from focusflick_core import FocusCore, LevelCurve, LinearCurve, QuadraticCurve, SessionStore, TaskStore, default_data, new_session
+
+DAY = datetime(2026, 3, 2, 10, 0)
+
+
+class FocusCoreTest(unittest.TestCase):
+    def setUp(self):
+        self.core = FocusCore(default_data())
+        self.user = self.core.data["user"]
+
+    def session(self, seconds, now=DAY, mode="focus"):
+        return self.core.commit_session(new_session(mode, seconds, now), self.core.apply_payload)
+
+    def test_session_credits_time_and_xp(self):
+        self.assertTrue(self.session(25 * 60))
+        self.assertEqual((self.user["sessions"], self.user["total_seconds"], self.user["xp"]), (1, 1500, 250))
+        day = self.core.data["rollup"][date.today().isoformat()]
+        self.assertEqual(day[:2], [1500, 1])
+
+    def test_short_session_is_not_credited(self):
+        self.assertFalse(self.session(59))
+        self.assertEqual((self.user["sessions"], self.user["xp"]), (0, 0))
+
+    def test_level_up_over_several_levels(self):
+        # Linear curve: level n needs n * 1000 XP, 6000 XP reaches level 4
+        self.session(600 * 60)
+        self.assertEqual((self.user["level"], self.user["xp"]), (4, 0))
+
+    def test_streak_rolls_over_days(self):
+        self.session(1500, DAY)
+        self.session(1500, DAY + timedelta(hours=3))
+        self.assertEqual(self.user["streak"], 1)
+        self.session(1500, DAY + timedelta(days=1))
+        self.session(1500, DAY + timedelta(days=2))
+        self.assertEqual(self.user["streak"], 3)
+        # A missed day starts over
+        self.session(1500, DAY + timedelta(days=4))
+        self.assertEqual(self.user["streak"], 1)
+
+    def test_achievements_unlock_once(self):
+        for i in range(10):
+            self.session(1500, DAY + timedelta(days=i))
+        unlocked = [a["id"] for a in self.user["achievements"]]
+        self.assertEqual(unlocked, ["first_session", "streak_7", "sessions_10"])
+        self.session(1500, DAY + timedelta(days=10))
+        self.assertEqual(len(self.user["achievements"]), 3)
+
+    def test_pomodoro_phases(self):
+        settings = self.core.data["settings"]
+        engine = self.core.session_engine
+        self.assertEqual(engine.next_phase("focus", 1, settings), ("short_break", 5 * 60, "Short Break"))
+        self.assertEqual(engine.next_phase("focus", 4, settings), ("long_break", 15 * 60, "Long Break"))
+        self.assertEqual(engine.next_phase("short_break", 1, settings), ("focus", 25 * 60, "Focus Session 2 of 4"))
+        self.assertEqual(engine.next_phase("long_break", 4, settings)[0], "focus")
+
+    def test_task_and_habit_xp(self):
+        task = {"id": "t1", "name": "Essay", "priority": 2, "completed": False}
+        self.core.apply_payload("task_added", {"task": task})
+        self.core.toggle_task(task, True, DAY, self.core.apply_payload)
+        self.assertEqual(self.user["xp"], 50)
+        habit = {"id": "h1", "name": "Read", "active": True}
+        self.core.apply_payload("habit_added", {"habit": habit})
+        self.core.toggle_habit(habit, True, DAY.date(), self.core.apply_payload)
+        self.core.toggle_habit(habit, True, DAY.date(), self.core.apply_payload)
+        self.assertEqual(self.user["xp"], 65)
+
+    def test_many_simulated_sessions(self):
+        sessions = SessionStore()
+        core = FocusCore(default_data(), sessions)
+        for i in range(2000):
+            now = DAY + timedelta(hours=i * 6)
+            core.commit_session(new_session("focus", 1500, now), core.apply_payload)
+        user = core.data["user"]
+        self.assertEqual((user["sessions"], user["total_seconds"]), (2000, 2000 * 1500))
+        # Sessions every six hours from 10:00 touch 501 consecutive days
+        self.assertEqual(user["streak"], 501)
+        self.assertEqual(core.progress.curve.total(user["level"]) + user["xp"], 2000 * 250)
+
+
+class LevelCurveTest(unittest.TestCase):
+    def test_curve_without_needed_cannot_be_built(self):
+        class Incomplete(LevelCurve):
+            pass
+        with self.assertRaises(TypeError):
+            Incomplete()
+
+    def test_closed_forms_match_the_generic_ones(self):
+        for curve in (LinearCurve(), QuadraticCurve()):
+            for level in range(1, 50):
+                self.assertEqual(curve.total(level), LevelCurve.total(curve, level))
+            for total in range(0, 200000, 777):
+                self.assertEqual(curve.level_for(total), LevelCurve.level_for(curve, total))
+
+
+class TaskOptionsTest(unittest.TestCase):
+    def store(self, *names):
+        data = default_data()
+        data["user"]["tasks"] = [{"id": f"t{i}", "name": name, "completed": False} for i, name in enumerate(names)]
+        return TaskStore(data)
+
+    def assert_pickable(self, store, count):
+        labels = store.options()
+        self.assertEqual(len(labels), len(set(labels)))
+        self.assertIsNone(store.option_task("None"))
+        picked = [store.option_task(label)["id"] for label in labels[1:]]
+        self.assertEqual(sorted(picked), [f"t{i}" for i in range(count)])
+
+    def test_suffix_skips_existing_names(self):
+        store = self.store("Foo", "Foo", "Foo (2)")
+        self.assertEqual(store.options(), ["None", "Foo", "Foo (3)", "Foo (2)"])
+        self.assert_pickable(store, 3)
+
+    def test_none_is_reserved(self):
+        store = self.store("None", "None")
+        self.assertEqual(store.options(), ["None", "None (2)", "None (3)"])
+        self.assert_pickable(store, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
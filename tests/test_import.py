@@ -0,0 +1,134 @@
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import focusflick_import
+from focusflick_core import FocusCore, SessionStore, default_data
+from focusflick_import import ImportFormatError, JsonStream, merge_events, read_export
+
+START = datetime(2026, 3, 2, 9, 0).timestamp()
+
+
+def export():
+    """A small export with every record type"""
+    data = default_data()
+    data["user"]["xp"] = 12345
+    data["user"]["tasks"] = [
+        {"id": "t1", "name": "Write éssay \"draft\"", "priority": 3, "completed": False,
+         "created": "2026-03-01T08:00:00", "notes": [{"date": "2026-03-01T09:00:00", "content": "Outline"}]},
+        {"id": "t2", "name": "Done", "completed": True, "created": "2026-03-01T08:00:00",
+         "completed_date": "2026-03-02T08:00:00"}
+    ]
+    data["user"]["habits"] = [{"id": "h1", "name": "Read", "completions": ["2026-03-01", "2026-03-02"]}]
+    data["user"]["achievements"] = [{"id": "first_session", "title": "First Focus", "date": "2026-03-01"}]
+    data["sessions"] = [[START + i * 3600, START + i * 3600 + 1500.25, "focus", "t1", 1500] for i in range(30)]
+    return data
+
+
+class ImportTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def write(self, content):
+        path = os.path.join(self.tmp.name, "export.json")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content if isinstance(content, str) else json.dumps(content, indent=2))
+        return path
+
+
+class JsonStreamTest(ImportTestCase):
+    def test_values_split_across_chunks(self):
+        text = '{"a": 123456789.125, "b": "long \\u00e9 string \\"quoted\\"", "c": [1, -2e10, true, null]}'
+        for size in (1, 2, 3, 7):
+            with mock.patch.object(focusflick_import, "CHUNK_SIZE", size):
+                stream = JsonStream(io.StringIO(text), len(text))
+                values = {key: stream.value() for key in stream.items()}
+                self.assertEqual(values, json.loads(text))
+                self.assertEqual(stream.peek(), "")
+
+    def test_number_at_end_of_chunk_is_not_cut(self):
+        text = "[12345, 6]"
+        with mock.patch.object(focusflick_import, "CHUNK_SIZE", 3):
+            stream = JsonStream(io.StringIO(text), len(text))
+            self.assertEqual([stream.value() for _ in stream.elements()], [12345, 6])
+
+    def test_read_export_with_tiny_chunks(self):
+        data = export()
+        path = self.write(data)
+        expected = read_export(path)
+        with mock.patch.object(focusflick_import, "CHUNK_SIZE", 5):
+            result = read_export(path)
+        self.assertEqual(result["data"]["user"]["tasks"], expected["data"]["user"]["tasks"])
+        self.assertEqual(result["data"]["user"]["tasks"][0]["name"], "Write éssay \"draft\"")
+        self.assertEqual(result["data"]["user"]["habits"][0]["completions"], ["2026-03-01", "2026-03-02"])
+        self.assertEqual(result["sessions"], [tuple(row) for row in data["sessions"]])
+        self.assertEqual(result["counts"], {"tasks": 2, "habits": 1, "sessions": 30})
+        self.assertEqual(result["data"]["user"]["xp"], 12345)
+
+
+class ValidationTest(ImportTestCase):
+    def test_invalid_records_are_reported_and_skipped(self):
+        data = export()
+        data["user"]["tasks"].append({"id": "t3"})
+        data["user"]["tasks"].append({"id": "t4", "name": "Bad", "priority": True})
+        data["user"]["habits"][0]["completions"].append("yesterday")
+        data["user"]["xp"] = "lots"
+        data["settings"]["focus_duration"] = "25"
+        data["sessions"].append([START, START + 10, "nap", None, 10])
+        result = read_export(self.write(data))
+        # Reported in file order, the user fields come before the task list
+        self.assertEqual(result["errors"], [
+            "user.xp: expected int",
+            "user.tasks[2]: missing name",
+            "user.tasks[3].priority: expected int",
+            "user.habits[0].completions[2]: not an ISO date",
+            "settings.focus_duration: expected int",
+            "sessions[30]: expected [start, end, mode, task, seconds]"
+        ])
+        self.assertEqual(result["skipped"], 6)
+        self.assertEqual(result["counts"], {"tasks": 2, "habits": 1, "sessions": 30})
+        self.assertEqual(result["data"]["user"]["xp"], 0)
+        self.assertEqual(result["data"]["settings"]["focus_duration"], 25)
+
+    def test_error_list_is_capped(self):
+        data = export()
+        data["sessions"] = [["bad"]] * 100
+        result = read_export(self.write(data))
+        self.assertEqual(len(result["errors"]), focusflick_import.MAX_REPORTED_ERRORS)
+        self.assertEqual(result["skipped"], 100)
+
+    def test_not_an_export(self):
+        for content in ("[1, 2]", '{"user": {}} trailing', '{"user": '):
+            with self.assertRaises(ImportFormatError):
+                read_export(self.write(content))
+
+
+class MergeEventsTest(ImportTestCase):
+    def test_merging_twice_adds_nothing(self):
+        imported = read_export(self.write(export()))
+        sessions = SessionStore()
+        core = FocusCore(default_data(), sessions)
+        events = merge_events(core.data, sessions, imported)
+        self.assertTrue(events)
+        for event_type, payload in events:
+            core.apply_payload(event_type, payload)
+        self.assertEqual(len(sessions), 30)
+        self.assertEqual(core.tasks.get("t1")["notes"], [{"date": "2026-03-01T09:00:00", "content": "Outline"}])
+        self.assertTrue(core.tasks.get("t2")["completed"])
+        self.assertEqual(core.habits.get("h1")["completions"], ["2026-03-01", "2026-03-02"])
+        # Totals and XP come from the merged records, never from the imported user
+        self.assertEqual(core.data["user"]["xp"], 0)
+        self.assertEqual(merge_events(core.data, sessions, imported), [])
+        self.assertEqual(merge_events(core.data, sessions, read_export(self.write(export()))), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+import copy
+import json
+import os
+import sys
+import tempfile
+import time
+import unittest
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from focusflick_core import (
+    FOCUS_SECONDS,
+    SCHEMA_VERSION,
+    SESSIONS,
+    SessionStore,
+    default_data,
+    ensure_fields,
+    fill_defaults,
+    migrate_data,
+)
+from focusflick_storage import JsonStorage, load_storage
+
+
+def version_0():
+    """Data tree as written before schema_version, ids and rollup"""
+    return {
+        "user": {
+            "name": "Old",
+            "xp": 40,
+            "tasks": [
+                {"name": "No id", "completed": True, "completed_date": "2025-05-01T10:00:00"},
+                {"id": "t2", "name": "Open"}
+            ],
+            "habits": [{"name": "Read", "completions": ["2025-05-01"]}],
+            "achievements": []
+        },
+        "settings": {"theme": "light", "focus_duration": 30}
+    }
+
+
+class FillDefaultsTest(unittest.TestCase):
+    def test_adds_missing_keys_and_keeps_existing(self):
+        data = {"settings": {"theme": "light"}, "extra": 1}
+        fill_defaults(data, {"settings": {"theme": "dark", "sounds": True}, "sync": {"offsets": {}}})
+        self.assertEqual(data, {"settings": {"theme": "light", "sounds": True}, "sync": {"offsets": {}}, "extra": 1})
+
+
+class EnsureFieldsTest(unittest.TestCase):
+    def test_fills_ids_and_item_fields(self):
+        data = version_0()
+        self.assertTrue(ensure_fields(data))
+        done, open_task = data["user"]["tasks"]
+        self.assertTrue(done["id"])
+        self.assertEqual(done["created"], "2025-05-01T10:00:00")
+        self.assertEqual((open_task["priority"], open_task["completed"]), (3, False))
+        self.assertTrue(data["user"]["habits"][0]["active"])
+        self.assertFalse(ensure_fields(data))
+
+
+class MigrateDataTest(unittest.TestCase):
+    def test_version_0_is_upgraded(self):
+        data = version_0()
+        sessions = SessionStore()
+        sessions.add(1746090000.0, 1746091500.0, "focus", None, 1500)
+        self.assertTrue(migrate_data(data, sessions))
+        self.assertEqual(data["schema_version"], SCHEMA_VERSION)
+        self.assertEqual(data["settings"]["theme"], "light")
+        self.assertEqual(data["settings"]["archive_after_days"], default_data()["settings"]["archive_after_days"])
+        self.assertEqual(data["sync_stamps"], {})
+        self.assertTrue(all("id" in task for task in data["user"]["tasks"]))
+        self.assertEqual(sum(counters[SESSIONS] for counters in data["rollup"].values()), 1)
+
+    def test_current_version_is_left_alone(self):
+        # Missing fields stay missing, the fast path looks at nothing else
+        data = {"schema_version": SCHEMA_VERSION, "user": {"tasks": [{"name": "x"}]}}
+        before = copy.deepcopy(data)
+        self.assertFalse(migrate_data(data, SessionStore()))
+        self.assertEqual(data, before)
+
+    def test_newer_version_is_left_alone(self):
+        data = {"schema_version": SCHEMA_VERSION + 1, "user": {"tasks": []}}
+        before = copy.deepcopy(data)
+        self.assertFalse(migrate_data(data, SessionStore()))
+        self.assertEqual(data, before)
+
+    def test_new_data_is_current(self):
+        self.assertFalse(migrate_data(default_data(), SessionStore()))
+
+
+class RollupBackfillTest(unittest.TestCase):
+    def test_logged_event_does_not_hide_older_history(self):
+        # A pre-rollup snapshot, a session 10 days old and one logged event since
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = [os.path.join(tmp, name) for name in ("data.json", "events.log", "sessions.csv")]
+            with open(paths[0], "w", encoding="utf-8") as f:
+                json.dump(dict(version_0(), log_seq=0), f)
+            storage = JsonStorage(*paths)
+            started = time.time() - 10 * 86400
+            storage.append_session(started, started + 1500, "focus", None, 1500)
+            today = date.today().isoformat()
+            storage.append({"type": "time_credited", "seconds": 60, "day": today, "seq": 1}, None)
+            
+            loaded = load_storage(storage)
+            storage.close()
+        
+        self.assertTrue(loaded["migrated"])
+        self.assertEqual(loaded["replayed"], 1)
+        data = loaded["data"]
+        old_day = (date.today() - timedelta(days=10)).isoformat()
+        self.assertEqual(data["rollup"][old_day][FOCUS_SECONDS], 1500)
+        self.assertEqual(data["rollup"][today][FOCUS_SECONDS], 60)
+
+    def test_nothing_stored_starts_from_the_defaults(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            storage = JsonStorage(*(os.path.join(tmp, name) for name in ("data.json", "events.log", "sessions.csv")))
+            loaded = load_storage(storage)
+            storage.close()
+        self.assertFalse(loaded["loaded"])
+        self.assertFalse(loaded["migrated"])
+        self.assertEqual(loaded["data"]["schema_version"], SCHEMA_VERSION)
+
+
+if __name__ == "__main__":
+    unittest.main()
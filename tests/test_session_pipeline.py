@@ -0,0 +1,99 @@
+import os
+import sys
+import threading
+import unittest
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from focusflick_core import FocusCore, SessionPipeline, default_data, new_session
+
+NOW = datetime(2026, 3, 2, 10, 0)
+
+
+class SessionPipelineTest(unittest.TestCase):
+    def setUp(self):
+        self.pipeline = SessionPipeline()
+        self.calls = []
+
+    def stage(self, name, result=None):
+        def run(session, emit):
+            self.calls.append(name)
+            return result
+        return run
+
+    def test_stages_run_in_order(self):
+        self.pipeline.add_stage("a", self.stage("a"))
+        self.pipeline.add_stage("c", self.stage("c"))
+        self.pipeline.add_stage("b", self.stage("b"), before="c")
+        self.pipeline.add_stage("post", lambda session: self.calls.append("post"), post_commit=True)
+        self.pipeline.subscribe(lambda session: self.calls.append("subscriber"))
+        self.assertTrue(self.pipeline.run({}, None))
+        self.assertEqual(self.calls, ["a", "b", "c", "post", "subscriber"])
+
+    def test_false_stops_the_rest(self):
+        self.pipeline.add_stage("a", self.stage("a", False))
+        self.pipeline.add_stage("b", self.stage("b"))
+        self.pipeline.add_stage("post", lambda session: self.calls.append("post"), post_commit=True)
+        self.pipeline.subscribe(lambda session: self.calls.append("subscriber"))
+        self.assertFalse(self.pipeline.run({}, None))
+        self.assertEqual(self.calls, ["a"])
+
+    def test_remove_stage(self):
+        self.pipeline.add_stage("a", self.stage("a"))
+        self.pipeline.add_stage("post", lambda session: self.calls.append("post"), post_commit=True)
+        self.pipeline.remove_stage("a")
+        self.pipeline.remove_stage("post")
+        self.pipeline.run({}, None)
+        self.assertEqual(self.calls, [])
+
+    def test_lock_is_released_before_post_commit_stages(self):
+        lock = threading.Lock()
+        held = []
+        self.pipeline.add_stage("commit", lambda session, emit: held.append(lock.locked()))
+        self.pipeline.add_stage("notify", lambda session: held.append(lock.locked()), post_commit=True)
+        self.pipeline.run({}, None, lock)
+        self.assertEqual(held, [True, False])
+
+
+class CoreSessionTest(unittest.TestCase):
+    """The core stages with a persistence stage like the app's"""
+
+    def setUp(self):
+        self.core = FocusCore(default_data())
+        self.persisted = []
+        self.core.session_pipeline.add_stage("persistence", self.persist)
+
+    def persist(self, session, emit):
+        self.persisted.append(list(session["events"]))
+
+    def commit(self, seconds, task=None, notes=""):
+        session = new_session("focus", seconds, NOW, task=task, notes=notes)
+        session["events"] = []
+        
+        def emit(event_type, payload):
+            self.core.apply_payload(event_type, payload)
+            session["events"].append(event_type)
+        
+        return self.core.commit_session(session, emit), session
+
+    def test_one_persist_with_every_event(self):
+        task = {"id": "t1", "name": "Essay", "priority": 1, "completed": False}
+        self.core.apply_payload("task_added", {"task": task})
+        committed, session = self.commit(1500, task, "Outline done")
+        self.assertTrue(committed)
+        self.assertEqual(len(self.persisted), 1)
+        self.assertEqual(
+            self.persisted[0],
+            ["session_completed", "task_note_added", "streak_updated", "achievement_unlocked"]
+        )
+
+    def test_short_session_is_not_persisted(self):
+        committed, session = self.commit(30)
+        self.assertFalse(committed)
+        self.assertEqual(self.persisted, [])
+        self.assertEqual(self.core.data["user"]["sessions"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
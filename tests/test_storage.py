@@ -0,0 +1,133 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from focusflick_core import FocusCore, SessionStore, apply_event, default_data
+from focusflick_storage import JsonStorage, SqliteStorage
+
+
+def task(task_id, name):
+    return {"id": task_id, "name": name, "priority": 2, "completed": False, "created": "2026-01-01T09:00:00"}
+
+
+class SqliteStorageTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "focusflick.db")
+        self.storage = SqliteStorage(self.path)
+        self.data = default_data()
+        self.storage.replace_all(self.data, SessionStore())
+
+    def tearDown(self):
+        self.storage.close()
+        self.tmp.cleanup()
+
+    def record(self, event_type, **payload):
+        event = {"type": event_type, "day": "2026-01-01", **payload}
+        apply_event(self.data, event)
+        self.data["log_seq"] = self.data.get("log_seq", 0) + 1
+        event["seq"] = self.data["log_seq"]
+        self.storage.append(event, self.data)
+
+    def reload(self):
+        self.storage.close()
+        self.storage = SqliteStorage(self.path)
+        return self.storage.load()
+
+    def test_stale_snapshot_keeps_later_appends(self):
+        text, seq = self.storage.capture(self.data)
+        self.record("task_added", task=task("t1", "Read"))
+        self.storage.write(text, seq)
+        self.assertEqual([t["id"] for t in self.reload()["user"]["tasks"]], ["t1"])
+
+    def test_snapshot_after_failed_append_rewrites_tables(self):
+        apply = self.storage._apply
+        self.storage._apply = lambda event, data, find: 1 / 0
+        with self.assertRaises(ZeroDivisionError):
+            self.record("task_added", task=task("t1", "Read"))
+        self.storage._apply = apply
+        self.storage.write(*self.storage.capture(self.data))
+        self.assertEqual([t["id"] for t in self.reload()["user"]["tasks"]], ["t1"])
+
+    def test_append_after_failed_append_writes_both(self):
+        apply = self.storage._apply
+        self.storage._apply = lambda event, data, find: 1 / 0
+        with self.assertRaises(ZeroDivisionError):
+            self.record("task_added", task=task("t1", "Read"))
+        self.storage._apply = apply
+        self.record("task_added", task=task("t2", "Write"))
+        self.assertEqual([t["id"] for t in self.reload()["user"]["tasks"]], ["t1", "t2"])
+
+    def test_add_after_delete_keeps_order(self):
+        for task_id in ("t1", "t2", "t3"):
+            self.record("task_added", task=task(task_id, task_id))
+        self.record("task_deleted", id="t1")
+        self.record("task_added", task=task("t4", "t4"))
+        self.record("task_updated", id="t2", fields={"name": "Renamed"})
+        positions = self.storage.conn.execute("SELECT id, position FROM tasks ORDER BY position").fetchall()
+        self.assertEqual([row[0] for row in positions], ["t2", "t3", "t4"])
+        self.assertEqual(len({row[1] for row in positions}), 3)
+        self.assertEqual([t["id"] for t in self.reload()["user"]["tasks"]], ["t2", "t3", "t4"])
+
+    def test_items_are_found_through_the_core_index(self):
+        core = FocusCore(self.data)
+        for task_id in ("t1", "t2"):
+            core.apply({"type": "task_added", "task": task(task_id, task_id)})
+        lookups = []
+        
+        def find(section, item_id):
+            lookups.append(item_id)
+            return core.find(section, item_id)
+        
+        event = {"type": "task_updated", "id": "t2", "fields": {"name": "Renamed"}, "seq": 1}
+        core.apply(event)
+        self.data["log_seq"] = 1
+        self.storage.append_many([event], self.data, find)
+        self.assertEqual(lookups, ["t2"])
+        self.assertEqual(self.storage.conn.execute("SELECT name FROM tasks WHERE id = 't2'").fetchone()[0], "Renamed")
+
+
+class JsonStorageTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.paths = [os.path.join(self.tmp.name, name) for name in ("data.json", "events.log", "sessions.csv")]
+        self.storage = JsonStorage(*self.paths)
+        self.data = default_data()
+
+    def record(self, event_type, **payload):
+        event = {"type": event_type, "day": "2026-01-01", **payload}
+        apply_event(self.data, event)
+        self.data["log_seq"] = self.data.get("log_seq", 0) + 1
+        event["seq"] = self.data["log_seq"]
+        self.storage.append(event, self.data)
+
+    def test_backup_generation_replays_to_the_latest_state(self):
+        for i in range(6):
+            self.record("task_added", task=task(f"t{i}", "Read"))
+            self.storage.save_all(self.data)
+        self.record("task_added", task=task("t6", "Read"))
+        self.storage.close()
+        # Lose every generation but the oldest
+        for path in self.storage.snapshots.generation_paths()[:-1]:
+            os.remove(path)
+        
+        storage = JsonStorage(*self.paths)
+        self.addCleanup(storage.close)
+        data = storage.load()
+        self.assertEqual(data["log_seq"], 3)
+        storage.replay(data)
+        self.assertEqual([t["id"] for t in data["user"]["tasks"]], [f"t{i}" for i in range(7)])
+
+    def test_segments_older_than_every_generation_are_dropped(self):
+        for i in range(6):
+            self.record("task_added", task=task(f"t{i}", "Read"))
+            self.storage.save_all(self.data)
+        self.assertEqual([seq for seq, path in self.storage.event_log.sealed_segments()], [4, 5, 6])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,167 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from focusflick_core import FocusCore, default_data
+from focusflick_sync import WAIT, SyncFolder, baseline_entry, merge_changes, plan_entry, stamp_event
+
+DAY = "2026-03-02"
+
+
+class Device:
+    """A headless FocusCore syncing through a folder with the app's merge"""
+
+    def __init__(self, folder, name):
+        data = default_data()
+        data["sync"].update({"device": name, "folder": folder})
+        self.name = name
+        self.core = FocusCore(data)
+        self.data = data
+        self.sync = SyncFolder(folder, name)
+
+    def record(self, at, event_type, **payload):
+        """Apply a local change stamped at time at and publish it"""
+        event = {"type": event_type, "day": DAY, "stamp": [at, self.name], **payload}
+        self.core.apply(event)
+        self.sync.publish([event])
+
+    def merge(self):
+        """Pull and apply the other devices' changes, returns the number merged"""
+        changes = self.sync.pull(self.data["sync"]["offsets"])
+        merged, rows = merge_changes(self.core, changes, self.core.apply_payload)
+        return merged
+
+    def task(self, task_id):
+        return self.core.tasks.get(task_id)
+
+
+class SyncTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.folder = tmp.name
+        self.a = self.device("a")
+        self.b = self.device("b")
+
+    def device(self, name):
+        device = Device(self.folder, name)
+        self.addCleanup(device.sync.close)
+        return device
+
+    def add_task(self, device, at, task_id="t1"):
+        device.record(at, "task_added", task={"id": task_id, "name": "Essay", "priority": 1, "completed": False})
+
+    def converge(self, *devices):
+        devices = devices or (self.a, self.b)
+        for device in devices:
+            device.merge()
+        first = devices[0].data["user"]
+        for device in devices[1:]:
+            self.assertEqual(device.data["user"]["tasks"], first["tasks"])
+            self.assertEqual(device.data["user"]["habits"], first["habits"])
+
+    def test_concurrent_field_edits_keep_newest_per_field(self):
+        self.add_task(self.a, 1)
+        self.b.merge()
+        self.a.record(10, "task_updated", id="t1", fields={"name": "Essay v2"})
+        self.a.record(15, "task_updated", id="t1", fields={"priority": 3})
+        self.b.record(20, "task_updated", id="t1", fields={"name": "Essay v3"})
+        self.b.record(5, "task_updated", id="t1", fields={"priority": 2})
+        self.converge()
+        self.assertEqual(self.a.task("t1")["name"], "Essay v3")
+        self.assertEqual(self.a.task("t1")["priority"], 3)
+
+    def test_delete_wins_over_later_edit(self):
+        self.add_task(self.a, 1)
+        self.b.merge()
+        self.a.record(10, "task_deleted", id="t1")
+        self.b.record(20, "task_updated", id="t1", fields={"name": "Essay v2"})
+        self.converge()
+        self.assertIsNone(self.a.task("t1"))
+        # A device joining later skips the edit of the deleted task too
+        c = self.device("c")
+        self.converge(self.a, self.b, c)
+        self.assertEqual(c.data["user"]["tasks"], [])
+
+    def test_delete_while_sync_was_off_does_not_stall_the_log(self):
+        self.add_task(self.a, 1)
+        self.b.merge()
+        # b deletes the task while sync is off, nothing is published
+        event = {"type": "task_deleted", "day": DAY, "id": "t1"}
+        stamp_event(event, "b", False)
+        self.b.core.apply(event)
+        self.a.record(10, "task_updated", id="t1", fields={"name": "Essay v2"})
+        self.add_task(self.a, 11, "t2")
+        self.assertEqual(self.b.merge(), 1)
+        self.assertIsNone(self.b.task("t1"))
+        self.assertIsNotNone(self.b.task("t2"))
+        self.assertEqual(self.b.data["sync"]["offsets"]["a"], os.path.getsize(os.path.join(self.folder, "a.jsonl")))
+
+    def test_only_deletions_are_stamped_while_sync_is_off(self):
+        edit = {"type": "task_updated", "id": "t1", "fields": {"name": "Essay"}}
+        stamp_event(edit, None, False)
+        self.assertNotIn("stamp", edit)
+        stamp_event(edit, "a", True)
+        self.assertEqual(edit["stamp"][1], "a")
+        delete = {"type": "habit_deleted", "id": "h1"}
+        stamp_event(delete, None, False)
+        self.assertEqual(delete["stamp"][1], "")
+
+    def test_unchecked_habit_day_stays_unchecked(self):
+        self.a.record(1, "habit_added", habit={"id": "h1", "name": "Read", "completions": [], "active": True})
+        self.a.record(2, "habit_completion_added", id="h1", date=DAY)
+        self.b.merge()
+        self.assertEqual(self.b.core.habits.get("h1")["completions"], [DAY])
+        self.b.record(5, "habit_completion_removed", id="h1", date=DAY)
+        # Checked again on a, but before b unchecked it
+        self.a.record(3, "habit_completion_removed", id="h1", date=DAY)
+        self.a.record(4, "habit_completion_added", id="h1", date=DAY)
+        self.converge()
+        self.assertEqual(self.a.core.habits.get("h1")["completions"], [])
+
+    def test_truncated_last_line_is_read_next_time(self):
+        self.add_task(self.a, 1)
+        path = os.path.join(self.folder, "a.jsonl")
+        complete = os.path.getsize(path)
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write('{"type":"task_updated","day":"2026-03-02","stamp":[2,"a"],"id":"t1","fie')
+        self.assertEqual(self.b.merge(), 1)
+        self.assertEqual(self.b.data["sync"]["offsets"]["a"], complete)
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write('lds":{"name":"Essay v2"}}\n')
+        self.assertEqual(self.b.merge(), 1)
+        self.assertEqual(self.b.task("t1")["name"], "Essay v2")
+        self.assertEqual(self.b.merge(), 0)
+
+    def test_waits_for_a_creation_from_another_device(self):
+        c = self.device("c")
+        self.add_task(c, 1)
+        self.a.merge()
+        self.a.record(2, "task_updated", id="t1", fields={"name": "Essay v2"})
+        # b reads a's log before c's, the edit waits for the task
+        self.assertEqual(plan_entry(self.b.core, "a", {"type": "task_updated", "id": "t1", "fields": {}}), WAIT)
+        self.b.merge()
+        self.assertEqual(self.b.task("t1")["name"], "Essay")
+        self.b.merge()
+        self.assertEqual(self.b.task("t1")["name"], "Essay v2")
+        self.converge(self.a, self.b, c)
+
+    def test_xp_baselines_count_once(self):
+        # Both devices start from copies of the same history, a got further
+        for device, total in ((self.a, 500), (self.b, 300)):
+            device.data["user"]["xp"] = total
+            device.core.apply({"type": "sync_baseline", "log": device.name, "total": total})
+            device.sync.publish([baseline_entry(total)])
+        self.a.record(1, "xp_awarded", amount=40)
+        self.b.record(1, "xp_awarded", amount=10)
+        self.converge()
+        self.assertEqual(self.a.data["user"]["xp"], 550)
+        self.assertEqual(self.b.data["user"]["xp"], 550)
+        self.assertEqual(self.a.merge() + self.b.merge(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
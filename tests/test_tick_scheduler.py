@@ -0,0 +1,63 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from focusflick_widgets import TickScheduler
+
+
+class FakeWidget:
+    """Keeps after() callbacks until the test runs them"""
+
+    def __init__(self):
+        self.pending = {}
+        self.next_id = 0
+
+    def after(self, delay, callback):
+        self.next_id += 1
+        self.pending[self.next_id] = callback
+        return self.next_id
+
+    def after_cancel(self, after_id):
+        self.pending.pop(after_id, None)
+
+    def run_pending(self):
+        pending, self.pending = self.pending, {}
+        for callback in pending.values():
+            callback()
+
+
+class TickSchedulerTest(unittest.TestCase):
+    def setUp(self):
+        self.widget = FakeWidget()
+        self.ticks = TickScheduler(self.widget, clock=lambda: 100.25)
+        self.calls = []
+
+    def test_one_pending_tick_for_all_subscribers(self):
+        self.ticks.subscribe("clock", lambda: self.calls.append("clock"))
+        self.ticks.subscribe("timer", lambda: self.calls.append("timer"))
+        self.assertEqual(len(self.widget.pending), 1)
+        self.widget.run_pending()
+        self.assertEqual(self.calls, ["clock", "timer", "clock", "timer"])
+        self.assertEqual(len(self.widget.pending), 1)
+
+    def test_failing_subscriber_does_not_stop_the_chain(self):
+        def broken():
+            if self.calls:
+                raise RuntimeError("widget destroyed")
+        self.ticks.subscribe("broken", broken)
+        self.ticks.subscribe("clock", lambda: self.calls.append("clock"))
+        for _ in range(3):
+            self.widget.run_pending()
+        self.assertEqual(self.calls, ["clock"] * 4)
+        self.assertEqual(len(self.widget.pending), 1)
+
+    def test_chain_stops_without_subscribers(self):
+        self.ticks.subscribe("clock", lambda: self.calls.append("clock"))
+        self.ticks.unsubscribe("clock")
+        self.assertEqual(self.widget.pending, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
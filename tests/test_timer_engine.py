@@ -0,0 +1,133 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from focusflick_core import TimerEngine
+
+
+class FakeClock:
+    """Clock that only moves when told to"""
+
+    def __init__(self, now=0.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TimerEngineTest(unittest.TestCase):
+    def setUp(self):
+        self.mono = FakeClock(1000.0)
+        self.wall = FakeClock(1.7e9)
+        self.timer = TimerEngine(max_gap=60, monotonic=self.mono, wall=self.wall)
+
+    def advance(self, seconds):
+        """Let seconds pass, ticking every second like the UI does"""
+        for _ in range(int(seconds)):
+            self.mono.now += 1
+            self.wall.now += 1
+            self.timer.tick()
+
+    def test_wall_clock_jumps_are_ignored(self):
+        self.timer.start()
+        self.advance(30)
+        self.wall.now -= 3600
+        self.advance(30)
+        self.wall.now += 7200
+        self.advance(30)
+        self.assertEqual(self.timer.elapsed(), 90)
+
+    def test_pause_and_resume(self):
+        self.timer.start()
+        self.advance(10)
+        self.timer.pause()
+        self.advance(50)
+        self.assertEqual(self.timer.elapsed(), 10)
+        self.timer.resume()
+        self.advance(5)
+        self.assertEqual(self.timer.stop(), 15)
+        self.assertFalse(self.timer.running)
+
+    def test_long_pause_is_not_a_gap(self):
+        # Time spent paused is never counted, however long
+        self.timer.start()
+        self.advance(10)
+        self.timer.pause()
+        self.mono.now += 3600
+        self.timer.resume()
+        self.advance(10)
+        self.assertEqual(self.timer.elapsed(), 20)
+
+    def test_suspension_longer_than_max_gap_is_dropped(self):
+        self.timer.start()
+        self.advance(20)
+        # The machine sleeps for an hour, nothing ticks. The whole interval
+        # up to the first tick after waking is dropped.
+        self.mono.now += 3600
+        self.advance(20)
+        self.assertEqual(self.timer.elapsed(), 39)
+
+    def test_gap_within_max_gap_is_counted(self):
+        self.timer.start()
+        self.advance(20)
+        self.mono.now += 45
+        self.advance(5)
+        self.assertEqual(self.timer.elapsed(), 70)
+
+    def test_no_max_gap_counts_everything(self):
+        timer = TimerEngine(monotonic=self.mono, wall=self.wall)
+        timer.start()
+        self.mono.now += 3600
+        self.assertEqual(timer.stop(), 3600)
+
+    def test_wall_anchor_is_taken_at_start(self):
+        # Sessions are stored by the wall time they started
+        self.timer.start()
+        started = self.wall.now
+        self.advance(10)
+        self.wall.now -= 86400
+        self.advance(10)
+        self.assertEqual(self.timer.started_wall, started)
+        self.timer.stop()
+        self.assertEqual(self.timer.started_wall, started)
+
+    def test_start_resets_the_previous_run(self):
+        self.timer.start()
+        self.advance(10)
+        self.timer.stop()
+        self.timer.start()
+        self.assertEqual(self.timer.started_wall, self.wall.now)
+        self.assertEqual(self.timer.elapsed(), 0)
+
+    def test_reset_clears_the_anchor(self):
+        self.timer.start()
+        self.advance(10)
+        self.timer.reset()
+        self.assertIsNone(self.timer.started_wall)
+        self.assertEqual(self.timer.elapsed(), 0)
+
+    def test_paused_start_waits_for_resume(self):
+        # A pomodoro phase that doesn't auto-start
+        self.timer.start(paused=True)
+        self.assertIsNone(self.timer.started_wall)
+        self.advance(30)
+        self.assertEqual(self.timer.elapsed(), 0)
+        self.timer.resume()
+        resumed = self.wall.now
+        self.advance(20)
+        self.assertEqual(self.timer.started_wall, resumed)
+        self.assertEqual(self.timer.stop(), 20)
+
+    def test_stop_while_waiting_credits_nothing(self):
+        self.timer.start()
+        self.advance(10)
+        self.timer.start(paused=True)
+        self.advance(30)
+        self.assertEqual(self.timer.stop(), 0)
+        self.assertIsNone(self.timer.started_wall)
+
+
+if __name__ == "__main__":
+    unittest.main()